@@ -1,14 +1,19 @@
 """Products API endpoints for CRUD operations."""
 
-import uuid
+import os
+from collections import deque
+from typing import Annotated
 
-from fastapi import APIRouter, Request, Response, status
+from fastapi import APIRouter, Path, Request, Response, status
+from pydantic import StringConstraints
 
 from src.config.settings import get_settings
 from src.core.exceptions import NotFoundError
 from src.core.logging import get_logger
 from src.core.rate_limit import get_limiter
 from src.models.product import (
+    PRODUCT_ID_MAX_LENGTH,
+    PRODUCT_ID_PATTERN,
     BulkOperationResult,
     IndexResponse,
     Product,
@@ -20,6 +25,54 @@ router = APIRouter(prefix="/api/v1/products", tags=["products"])
 logger = get_logger(__name__)
 limiter = get_limiter()
 settings = get_settings()
+indexing_service = get_indexing_service()
+
+# Malformed IDs are rejected with 422 before they cost an Elasticsearch
+# round-trip; the constraint matches Product.id
+ProductId = Annotated[
+    str,
+    Path(
+        min_length=1,
+        max_length=PRODUCT_ID_MAX_LENGTH,
+        pattern=PRODUCT_ID_PATTERN,
+        description="Product identifier",
+    ),
+]
+# The same constraint for IDs sent in a request body (bulk delete)
+ProductIdItem = Annotated[
+    str,
+    StringConstraints(
+        min_length=1,
+        max_length=PRODUCT_ID_MAX_LENGTH,
+        pattern=PRODUCT_ID_PATTERN,
+    ),
+]
+
+# Number of product IDs generated per os.urandom call
+_UUID_BATCH_SIZE = 256
+_uuid_pool: deque[str] = deque()
+
+# A forked worker must not hand out IDs already buffered by its parent
+os.register_at_fork(after_in_child=_uuid_pool.clear)
+
+
+def _next_uuid() -> str:
+    """Return a random version 4 UUID string.
+
+    Randomness for a whole batch of IDs is read with a single os.urandom
+    call; each 16-byte slice gets the RFC 4122 version and variant bits.
+
+    Returns:
+        UUID string in canonical 8-4-4-4-12 form.
+    """
+    if not _uuid_pool:
+        buf = bytearray(os.urandom(16 * _UUID_BATCH_SIZE))
+        for offset in range(0, len(buf), 16):
+            buf[offset + 6] = (buf[offset + 6] & 0x0F) | 0x40
+            buf[offset + 8] = (buf[offset + 8] & 0x3F) | 0x80
+            h = buf[offset : offset + 16].hex()
+            _uuid_pool.append(f"{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:]}")
+    return _uuid_pool.popleft()
 
 
 @router.post("", response_model=IndexResponse, status_code=status.HTTP_201_CREATED)
@@ -37,10 +90,8 @@ async def create_product(
     Returns:
         IndexResponse with the created product ID.
     """
-    indexing_service = get_indexing_service()
-
     # Generate a unique ID for the new product
-    product_id = str(uuid.uuid4())
+    product_id = _next_uuid()
 
     product = Product(
         id=product_id,
@@ -68,7 +119,7 @@ async def create_product(
 @router.get("/{product_id}", response_model=Product)
 @limiter.limit(settings.rate_limit_default)
 async def get_product(
-    request: Request, response: Response, product_id: str
+    request: Request, response: Response, product_id: ProductId
 ) -> Product:
     """Get a product by ID.
 
@@ -83,8 +134,6 @@ async def get_product(
     Raises:
         NotFoundError: 404 if product not found.
     """
-    indexing_service = get_indexing_service()
-
     product = await indexing_service.get_product(product_id)
 
     if product is None:
@@ -99,7 +148,10 @@ async def get_product(
 @router.put("/{product_id}", response_model=IndexResponse)
 @limiter.limit(settings.rate_limit_default)
 async def update_product(
-    request: Request, response: Response, product_id: str, product_data: ProductCreate
+    request: Request,
+    response: Response,
+    product_id: ProductId,
+    product_data: ProductCreate,
 ) -> IndexResponse:
     """Update an existing product.
 
@@ -115,8 +167,6 @@ async def update_product(
     Raises:
         NotFoundError: 404 if product not found.
     """
-    indexing_service = get_indexing_service()
-
     if not await indexing_service.product_exists(product_id):
         raise NotFoundError(
             message=f"Product with ID '{product_id}' not found",
@@ -149,7 +199,7 @@ async def update_product(
 @router.delete("/{product_id}", status_code=status.HTTP_204_NO_CONTENT)
 @limiter.limit(settings.rate_limit_default)
 async def delete_product(
-    request: Request, response: Response, product_id: str
+    request: Request, response: Response, product_id: ProductId
 ) -> Response:
     """Delete a product by ID.
 
@@ -164,8 +214,6 @@ async def delete_product(
     Raises:
         NotFoundError: 404 if product not found.
     """
-    indexing_service = get_indexing_service()
-
     result = await indexing_service.delete_product(product_id)
 
     if result is None:
@@ -194,8 +242,6 @@ async def bulk_index_products(
     Returns:
         BulkOperationResult with success/error counts.
     """
-    indexing_service = get_indexing_service()
-
     result = await indexing_service.bulk_index_products(products)
 
     logger.info(
@@ -211,7 +257,7 @@ async def bulk_index_products(
 @router.post("/bulk/delete", response_model=BulkOperationResult)
 @limiter.limit(settings.rate_limit_bulk)
 async def bulk_delete_products(
-    request: Request, response: Response, product_ids: list[str]
+    request: Request, response: Response, product_ids: list[ProductIdItem]
 ) -> BulkOperationResult:
     """Bulk delete multiple products.
 
@@ -223,8 +269,6 @@ async def bulk_delete_products(
     Returns:
         BulkOperationResult with success/error counts.
     """
-    indexing_service = get_indexing_service()
-
     result = await indexing_service.bulk_delete_products(product_ids)
 
     logger.info(
@@ -1,7 +1,6 @@
 """Application configuration using Pydantic Settings."""
 
-from functools import lru_cache
-
+from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -12,6 +11,7 @@ class Settings(BaseSettings):
         env_file=".env",
         env_file_encoding="utf-8",
         case_sensitive=False,
+        frozen=True,
     )
 
     # Application
@@ -22,6 +22,9 @@ class Settings(BaseSettings):
     # Server
     host: str = "0.0.0.0"
     port: int = 8000
+    # uvicorn worker processes (uvicorn reads the same WEB_CONCURRENCY variable).
+    # Rate-limit counters (without redis_url) and the search cache are per worker.
+    web_concurrency: int = 1
 
     # Elasticsearch
     elasticsearch_url: str = "http://localhost:9200"
@@ -29,10 +32,31 @@ class Settings(BaseSettings):
     elasticsearch_timeout: int = 30
     elasticsearch_number_of_shards: int = 1
     elasticsearch_number_of_replicas: int = 0
+    elasticsearch_connections_per_node: int = 10  # Keep-alive pool size per ES node
+    # gzip request bodies; worth it only when Elasticsearch is across a WAN
+    elasticsearch_http_compress: bool = False
+    elasticsearch_health_cache_seconds: float = 1.0  # Reuse cluster health for /health
+
+    # Bulk Indexing
+    bulk_chunk_size: int = 500  # Actions per _bulk request
+    bulk_max_chunk_bytes: int = 5 * 1024 * 1024
+    bulk_max_retries: int = 3  # Retries for actions rejected with 429
+    bulk_max_reported_errors: int = 100  # Failed items kept in bulk responses
+
+    # Search
+    # Fuzzy terms must share this many leading characters with the query term,
+    # which bounds how much of the term dictionary the edit-distance automaton walks
+    search_fuzzy_prefix_length: int = 1
+    search_fuzzy_max_expansions: int = 50
+    # Count matches exactly up to this many (or past the requested page, if
+    # deeper); beyond it the reported total is a lower bound
+    search_track_total_hits: int = 1000
 
     # Logging
     log_level: str = "INFO"
     log_format: str = "json"  # 'json' for production, 'console' for development
+    # Records waiting for the writer thread; beyond this they are dropped
+    log_queue_size: int = Field(10000, ge=1)
 
     # Rate Limiting
     rate_limit_enabled: bool = True
@@ -41,8 +65,22 @@ class Settings(BaseSettings):
     rate_limit_bulk: str = "50/minute"
     redis_url: str | None = None  # Optional Redis URL for distributed rate limiting
 
+    # Response Compression (gzip, only for clients sending Accept-Encoding)
+    gzip_minimum_size: int = 512  # Bytes; smaller bodies are sent uncompressed
+    gzip_compresslevel: int = 5
+
+    # Search Cache (per-process; other workers may lag writes by up to the TTL)
+    cache_enabled: bool = True
+    cache_ttl_seconds: int = Field(30, ge=1)
+    cache_max_size: int = Field(1000, ge=1)  # disable with CACHE_ENABLED=false
+
+
+_settings: Settings | None = None
+
 
-@lru_cache
 def get_settings() -> Settings:
     """Get cached settings instance."""
-    return Settings()
+    global _settings  # noqa: PLW0603
+    if _settings is None:
+        _settings = Settings()
+    return _settings
@@ -7,7 +7,7 @@ from src.core.exceptions import (
     RateLimitError,
     ValidationError,
 )
-from src.core.logging import get_logger, setup_logging
+from src.core.logging import get_logger, setup_logging, shutdown_logging
 from src.core.rate_limit import get_limiter, rate_limit_exceeded_handler
 
 __all__ = [
@@ -20,4 +20,5 @@ __all__ = [
     "get_logger",
     "rate_limit_exceeded_handler",
     "setup_logging",
+    "shutdown_logging",
 ]
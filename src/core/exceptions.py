@@ -5,7 +5,8 @@ from typing import Any
 from fastapi import Request
 from fastapi.responses import JSONResponse
 
-from src.core.logging import get_logger, request_id_var
+from src.core.logging import get_logger, get_request_id
+from src.core.responses import ORJSONResponse
 
 logger = get_logger(__name__)
 
@@ -35,8 +36,15 @@ class FindoraException(Exception):
         self.details = details or {}
         super().__init__(self.message)
 
-    def to_dict(self) -> dict[str, Any]:
-        """Convert exception to dictionary for JSON response."""
+    def to_dict(self, request_id: str | None = None) -> dict[str, Any]:
+        """Convert exception to dictionary for JSON response.
+
+        Args:
+            request_id: ID of the current request, included if provided.
+
+        Returns:
+            Error response body.
+        """
         response: dict[str, Any] = {
             "error": {
                 "code": self.error_code,
@@ -45,7 +53,6 @@ class FindoraException(Exception):
         }
 
         # Add request_id if available
-        request_id = request_id_var.get()
         if request_id:
             response["error"]["request_id"] = request_id
 
@@ -88,6 +95,10 @@ class RateLimitError(FindoraException):
     message = "Too many requests. Please try again later"
 
 
+# Error body for unexpected exceptions (FindoraException defaults)
+_FALLBACK_ERROR: dict[str, Any] = FindoraException().to_dict()["error"]
+
+
 async def global_exception_handler(request: Request, exc: Exception) -> JSONResponse:
     """Global exception handler for all unhandled exceptions.
 
@@ -98,6 +109,8 @@ async def global_exception_handler(request: Request, exc: Exception) -> JSONResp
     Returns:
         JSONResponse with error details.
     """
+    request_id = get_request_id()
+
     if isinstance(exc, FindoraException):
         # Log at appropriate level based on status code
         if exc.status_code >= SERVER_ERROR_THRESHOLD:
@@ -116,9 +129,9 @@ async def global_exception_handler(request: Request, exc: Exception) -> JSONResp
                 path=str(request.url.path),
             )
 
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=exc.status_code,
-            content=exc.to_dict(),
+            content=exc.to_dict(request_id=request_id),
         )
 
     # Unexpected exception - log full details
@@ -129,9 +142,12 @@ async def global_exception_handler(request: Request, exc: Exception) -> JSONResp
         path=str(request.url.path),
     )
 
-    # Return generic error response using base exception for consistency
-    error = FindoraException()
-    return JSONResponse(
-        status_code=error.status_code,
-        content=error.to_dict(),
+    # Return the generic error body of the base exception, without building one
+    error = dict(_FALLBACK_ERROR)
+    if request_id:
+        error["request_id"] = request_id
+
+    return ORJSONResponse(
+        status_code=FindoraException.status_code,
+        content={"error": error},
     )
@@ -1,52 +1,113 @@
 """Structured logging configuration using structlog."""
 
+import atexit
 import logging
+import queue
 import sys
-from collections.abc import MutableMapping
-from contextvars import ContextVar
+from contextvars import ContextVar, Token
+from logging.handlers import QueueHandler, QueueListener
 from typing import Any
 
 import structlog
+from structlog.types import EventDict, WrappedLogger
 
-# Context variable for request-scoped data
-request_id_var: ContextVar[str | None] = ContextVar("request_id", default=None)
+# Per-request log context (request_id, method, path), set once per request
+_request_context: ContextVar[dict[str, Any] | None] = ContextVar(
+    "request_context", default=None
+)
 
 
-def add_request_id(
-    _logger: Any, _method_name: str, event_dict: MutableMapping[str, Any]
-) -> MutableMapping[str, Any]:
-    """Add request_id to log entries if available.
+class BoundedQueueHandler(QueueHandler):
+    """Queue handler that never blocks the logging caller.
+
+    Records are dropped and counted when the queue is full. Once a fallback
+    handler is set (after the listener stops), records are written through
+    it directly instead of being queued.
+    """
+
+    def __init__(self, log_queue: queue.Queue[logging.LogRecord | None]) -> None:
+        """Initialize the handler.
+
+        Args:
+            log_queue: Bounded queue drained by a QueueListener.
+        """
+        super().__init__(log_queue)
+        self.dropped = 0
+        self.fallback: logging.Handler | None = None
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        """Queue a record, or write it through the fallback handler.
+
+        Args:
+            record: Prepared log record.
+        """
+        if self.fallback is not None:
+            self.fallback.handle(record)
+            return
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+class _BlockingStopListener(QueueListener):
+    """Queue listener whose stop sentinel waits for room in a full queue."""
+
+    def __init__(
+        self, log_queue: queue.Queue[logging.LogRecord | None], handler: logging.Handler
+    ) -> None:
+        super().__init__(log_queue, handler)
+        self.log_queue = log_queue
+
+    def enqueue_sentinel(self) -> None:
+        """Queue the stop sentinel (None), blocking until there is room."""
+        self.log_queue.put(None)
+
+
+# Root logging hands records to this handler; a listener thread writes them out
+_queue_handler = BoundedQueueHandler(queue.Queue())
+_log_listener: _BlockingStopListener | None = None
+_atexit_registered = False
+
+
+def merge_request_context(
+    _logger: WrappedLogger, _method_name: str, event_dict: EventDict
+) -> EventDict:
+    """Add the current request context to a log entry.
 
     Args:
-        _logger: Logger instance (unused, required by structlog processor signature).
-        _method_name: Method name (unused, required by structlog processor signature).
-        event_dict: Event dictionary to modify.
+        _logger: Wrapped logger (required by the processor signature).
+        _method_name: Log method name (required by the processor signature).
+        event_dict: Log entry being processed.
 
     Returns:
-        Modified event dictionary with request_id if available.
+        Log entry with request context; explicit keys take precedence.
     """
-    request_id = request_id_var.get()
-    if request_id:
-        event_dict["request_id"] = request_id
-    return event_dict
+    context = _request_context.get()
+    if context is None:
+        return event_dict
+    return {**context, **event_dict}
 
 
-def setup_logging(log_level: str = "INFO", log_format: str = "json") -> None:
+def setup_logging(
+    log_level: str = "INFO", log_format: str = "json", queue_size: int = 10000
+) -> None:
     """Configure structlog for the application.
 
     Args:
         log_level: Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL).
         log_format: Output format - 'json' for production, 'console' for development.
+        queue_size: Maximum log records waiting to be written; further records
+            are dropped rather than blocking the caller.
     """
     # Common processors for all formats
     shared_processors: list[structlog.types.Processor] = [
-        structlog.contextvars.merge_contextvars,
+        merge_request_context,
         structlog.stdlib.add_log_level,
         structlog.stdlib.add_logger_name,
         structlog.processors.TimeStamper(fmt="iso"),
         structlog.processors.StackInfoRenderer(),
         structlog.processors.UnicodeDecoder(),
-        add_request_id,
     ]
 
     if log_format == "console":
@@ -63,20 +124,38 @@ def setup_logging(log_level: str = "INFO", log_format: str = "json") -> None:
             structlog.processors.JSONRenderer(),
         ]
 
-    # Configure structlog
+    level = getattr(logging, log_level.upper())
+
+    # Configure structlog. The filtering wrapper turns calls below the
+    # configured level into no-ops, before any processor runs.
     structlog.configure(
         processors=processors,  # type: ignore[arg-type]
-        wrapper_class=structlog.stdlib.BoundLogger,
+        wrapper_class=structlog.make_filtering_bound_logger(level),
         context_class=dict,
         logger_factory=structlog.stdlib.LoggerFactory(),
         cache_logger_on_first_use=True,
     )
 
-    # Configure standard library logging
+    # Configure standard library logging. Records are handed to a bounded
+    # queue and written to stdout by a listener thread, so a slow or blocked
+    # stdout doesn't stall the event loop (or grow memory without limit).
+    global _log_listener, _atexit_registered  # noqa: PLW0603
+    shutdown_logging()
+    if not _atexit_registered:
+        # The listener thread is a daemon; flush it on any interpreter exit
+        atexit.register(shutdown_logging)
+        _atexit_registered = True
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(logging.Formatter("%(message)s"))
+    log_queue: queue.Queue[logging.LogRecord | None] = queue.Queue(queue_size)
+    _queue_handler.queue = log_queue
+    _queue_handler.fallback = None
+    _log_listener = _BlockingStopListener(log_queue, stream_handler)
+    _log_listener.start()
     logging.basicConfig(
         format="%(message)s",
-        stream=sys.stdout,
-        level=getattr(logging, log_level.upper()),
+        handlers=[_queue_handler],
+        level=level,
     )
 
     # Suppress noisy loggers
@@ -84,31 +163,77 @@ def setup_logging(log_level: str = "INFO", log_format: str = "json") -> None:
     logging.getLogger("uvicorn.access").setLevel(logging.WARNING)
 
 
-def get_logger(name: str | None = None) -> structlog.stdlib.BoundLogger:
+def shutdown_logging() -> None:
+    """Flush queued log records and stop the listener thread.
+
+    Records logged afterwards are written to the stream directly. Called on
+    application shutdown and, as a safety net, at interpreter exit.
+    """
+    global _log_listener  # noqa: PLW0603
+    if _log_listener is None:
+        return
+    listener = _log_listener
+    _log_listener = None
+    listener.stop()
+    stream_handler = listener.handlers[0]
+
+    # Switch to direct writes only once the queue has been drained, then
+    # write out anything queued after the stop sentinel, in order
+    _queue_handler.fallback = stream_handler
+    while True:
+        try:
+            record = listener.log_queue.get_nowait()
+        except queue.Empty:
+            break
+        if record is not None:
+            stream_handler.handle(record)
+
+    if _queue_handler.dropped:
+        dropped, _queue_handler.dropped = _queue_handler.dropped, 0
+        get_logger(__name__).warning("log_records_dropped", count=dropped)
+
+
+def get_logger(name: str | None = None) -> structlog.typing.FilteringBoundLogger:
     """Get a structured logger instance.
 
     Args:
         name: Logger name. If None, uses the calling module's name.
 
     Returns:
-        Configured structlog BoundLogger instance.
+        Configured structlog FilteringBoundLogger instance.
     """
     return structlog.get_logger(name)  # type: ignore[no-any-return]
 
 
-def bind_request_context(request_id: str, **kwargs: Any) -> None:
+def bind_request_context(
+    request_id: str, **kwargs: Any
+) -> Token[dict[str, Any] | None]:
     """Bind request context for structured logging.
 
     Args:
         request_id: Unique request identifier.
         **kwargs: Additional context to bind.
+
+    Returns:
+        Token to pass to clear_request_context.
     """
-    request_id_var.set(request_id)
-    structlog.contextvars.clear_contextvars()
-    structlog.contextvars.bind_contextvars(request_id=request_id, **kwargs)
+    return _request_context.set({"request_id": request_id, **kwargs})
+
 
+def clear_request_context(token: Token[dict[str, Any] | None]) -> None:
+    """Clear request context after request completes.
 
-def clear_request_context() -> None:
-    """Clear request context after request completes."""
-    request_id_var.set(None)
-    structlog.contextvars.clear_contextvars()
+    Args:
+        token: Token returned by bind_request_context.
+    """
+    _request_context.reset(token)
+
+
+def get_request_id() -> str | None:
+    """Get the ID of the request being handled.
+
+    Returns:
+        Request ID, or None outside a request.
+    """
+    context = _request_context.get()
+    return None if context is None else context["request_id"]
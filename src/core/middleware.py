@@ -0,0 +1,87 @@
+"""ASGI middleware for request tracking and logging."""
+
+import time
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.core.logging import bind_request_context, clear_request_context, get_logger
+from src.core.reqid import next_request_id
+
+logger = get_logger(__name__)
+
+# Liveness/readiness probes: no request ID, log context or access log
+_UNTRACKED_PATHS = frozenset({"/health"})
+
+
+class RequestContextMiddleware:
+    """Assign request IDs, bind log context, and log completed requests.
+
+    Implemented as plain ASGI rather than with ``@app.middleware("http")``,
+    which runs every request through an extra task and memory streams just
+    to provide ``call_next``. Here ``send`` is wrapped directly to read the
+    status code and append the ``X-Request-ID`` response header to the raw
+    header list.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        """Initialize the middleware.
+
+        Args:
+            app: The wrapped ASGI application.
+        """
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Handle an ASGI connection.
+
+        Args:
+            scope: Connection scope.
+            receive: ASGI receive callable.
+            send: ASGI send callable.
+        """
+        if scope["type"] != "http" or scope["path"] in _UNTRACKED_PATHS:
+            await self.app(scope, receive, send)
+            return
+
+        request_id = next_request_id()
+        method = scope["method"]
+        path = scope["path"]
+
+        # Expose the ID to handlers as request.state.request_id
+        scope.setdefault("state", {})["request_id"] = request_id
+
+        # Bind request context for logging
+        context_token = bind_request_context(
+            request_id=request_id, method=method, path=path
+        )
+
+        start_ns = time.perf_counter_ns()
+        status_code: int | None = None
+
+        async def send_with_request_id(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                # Copy rather than mutate: the list may be a Response's raw_headers
+                message["headers"] = [
+                    *message.get("headers", ()),
+                    (b"x-request-id", request_id.encode("ascii")),
+                ]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_request_id)
+        except Exception:
+            # Log unhandled exceptions (let them propagate for default handling)
+            logger.exception("unhandled_exception", path=path, method=method)
+            raise
+        else:
+            # Integer ns -> hundredths of a ms, so no float rounding is needed
+            duration_ms = (time.perf_counter_ns() - start_ns) // 10_000 / 100
+            logger.info(
+                "request_completed",
+                status_code=status_code,
+                duration_ms=duration_ms,
+            )
+        finally:
+            clear_request_context(context_token)
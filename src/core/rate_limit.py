@@ -1,6 +1,5 @@
 """Rate limiting configuration using SlowAPI."""
 
-from functools import lru_cache
 from typing import TYPE_CHECKING
 
 from fastapi import Request
@@ -9,7 +8,8 @@ from slowapi import Limiter
 from slowapi.util import get_remote_address
 
 from src.config.settings import get_settings
-from src.core.logging import get_logger, request_id_var
+from src.core.logging import get_logger, get_request_id
+from src.core.responses import ORJSONResponse
 
 if TYPE_CHECKING:
     from slowapi.errors import RateLimitExceeded
@@ -20,7 +20,9 @@ logger = get_logger(__name__)
 def get_client_ip(request: Request) -> str:
     """Get client IP address from request.
 
-    Handles X-Forwarded-For header for proxied requests.
+    Handles X-Forwarded-For header for proxied requests. The result is
+    memoized on ``request.state`` so the limiter key function and the
+    rate limit handler resolve it only once per request.
 
     Args:
         request: The incoming request.
@@ -28,32 +30,47 @@ def get_client_ip(request: Request) -> str:
     Returns:
         Client IP address string.
     """
+    client_ip: str | None = getattr(request.state, "client_ip", None)
+    if client_ip is not None:
+        return client_ip
+
     # Check for X-Forwarded-For header (common with reverse proxies)
     forwarded_for = request.headers.get("X-Forwarded-For")
     if forwarded_for:
-        # Take the first IP in the chain (original client)
-        return forwarded_for.split(",")[0].strip()
+        # Take the first IP in the chain (original client) without splitting
+        # the whole header into a list
+        comma = forwarded_for.find(",")
+        first = forwarded_for if comma < 0 else forwarded_for[:comma]
+        client_ip = first.strip()
+    else:
+        # Fall back to direct client address
+        client_ip = get_remote_address(request)
+
+    request.state.client_ip = client_ip
+    return client_ip
 
-    # Fall back to direct client address
-    return get_remote_address(request)
+
+_limiter: Limiter | None = None
 
 
-@lru_cache
 def get_limiter() -> Limiter:
     """Get the rate limiter instance.
 
     Returns:
         Configured SlowAPI Limiter instance.
     """
-    settings = get_settings()
-    return Limiter(
-        key_func=get_client_ip,
-        default_limits=[settings.rate_limit_default],
-        headers_enabled=True,
-        strategy="fixed-window",
-        storage_uri=settings.redis_url,
-        enabled=settings.rate_limit_enabled,
-    )
+    global _limiter  # noqa: PLW0603
+    if _limiter is None:
+        settings = get_settings()
+        _limiter = Limiter(
+            key_func=get_client_ip,
+            default_limits=[settings.rate_limit_default],
+            headers_enabled=True,
+            strategy="fixed-window",
+            storage_uri=settings.redis_url,
+            enabled=settings.rate_limit_enabled,
+        )
+    return _limiter
 
 
 def rate_limit_exceeded_handler(
@@ -68,7 +85,7 @@ def rate_limit_exceeded_handler(
     Returns:
         JSONResponse with rate limit error details.
     """
-    request_id = request_id_var.get()
+    request_id = get_request_id()
     client_ip = get_client_ip(request)
 
     logger.warning(
@@ -89,7 +106,7 @@ def rate_limit_exceeded_handler(
     if request_id:
         error_response["error"]["request_id"] = request_id
 
-    response = JSONResponse(
+    response = ORJSONResponse(
         status_code=429,
         content=error_response,
     )
@@ -0,0 +1,28 @@
+"""Request ID generation."""
+
+import os
+from collections import deque
+
+# Number of request IDs generated per os.urandom call
+_BATCH_SIZE = 512
+_ID_BYTES = 4
+_pool: deque[str] = deque()
+
+# A forked worker must not hand out IDs already buffered by its parent
+os.register_at_fork(after_in_child=_pool.clear)
+
+
+def next_request_id() -> str:
+    """Return a short random request ID.
+
+    Randomness for a whole batch of IDs is read and hex-encoded at once,
+    so most calls are a single deque pop.
+
+    Returns:
+        8-character lowercase hex string.
+    """
+    if not _pool:
+        chars = _ID_BYTES * 2
+        h = os.urandom(_ID_BYTES * _BATCH_SIZE).hex()
+        _pool.extend(h[i : i + chars] for i in range(0, len(h), chars))
+    return _pool.popleft()
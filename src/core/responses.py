@@ -0,0 +1,25 @@
+"""Response classes for the Findora API."""
+
+from typing import Any
+
+import orjson
+from fastapi.responses import JSONResponse
+
+
+class ORJSONResponse(JSONResponse):
+    """JSONResponse rendered with orjson.
+
+    Used for bodies built by hand in exception handlers. Route responses
+    with a response_model are already serialized by pydantic-core.
+    """
+
+    def render(self, content: Any) -> bytes:
+        """Serialize content to JSON bytes.
+
+        Args:
+            content: JSON-compatible response content.
+
+        Returns:
+            Encoded response body.
+        """
+        return orjson.dumps(content)
@@ -1,17 +1,25 @@
 """Elasticsearch client wrapper with connection management."""
 
 import asyncio
-from functools import lru_cache
+import random
+import time
 from typing import Any
 
 from elasticsearch import AsyncElasticsearch
 from elasticsearch import ConnectionError as ESConnectionError
+from elasticsearch.serializer import OrjsonSerializer
 
 from src.config.settings import Settings, get_settings
 from src.core.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Upper bound for the exponential backoff between connection attempts
+MAX_RETRY_DELAY_SECONDS = 30.0
+
+# Cluster health results that are safe to reuse between probes
+HEALTHY_CLUSTER_STATUSES = frozenset({"green", "yellow"})
+
 
 class ElasticsearchClient:
     """Wrapper for AsyncElasticsearch with connection management."""
@@ -24,6 +32,9 @@ class ElasticsearchClient:
         """
         self.settings = settings
         self._client: AsyncElasticsearch | None = None
+        # (monotonic time, result) of the last cluster health check
+        self._health_cache: tuple[float, dict[str, Any]] | None = None
+        self._health_lock = asyncio.Lock()
 
     async def get_client(self) -> AsyncElasticsearch:
         """Get or create the Elasticsearch client.
@@ -35,6 +46,10 @@ class ElasticsearchClient:
             self._client = AsyncElasticsearch(
                 hosts=[self.settings.elasticsearch_url],
                 request_timeout=self.settings.elasticsearch_timeout,
+                connections_per_node=self.settings.elasticsearch_connections_per_node,
+                http_compress=self.settings.elasticsearch_http_compress,
+                # orjson for request bodies (including bulk actions) and responses
+                serializer=OrjsonSerializer(),
             )
         return self._client
 
@@ -61,18 +76,61 @@ class ElasticsearchClient:
         """
         client = await self.get_client()
         response = await client.info()
-        return dict(response)
+        return response.body  # type: ignore[no-any-return]
 
     async def health_check(self) -> dict[str, Any]:
         """Get cluster health status.
 
+        Healthy results are reused for ``elasticsearch_health_cache_seconds``
+        so that frequent probes don't each cost a round trip to the cluster,
+        and concurrent probes on a cache miss share a single request. Red or
+        unavailable results are not cached, so recovery shows up immediately.
+
+        Returns:
+            Dictionary containing health status or error info.
+        """
+        now = time.monotonic()
+        cached = self._cached_health(now)
+        if cached is not None:
+            return cached
+
+        async with self._health_lock:
+            # Another probe may have refreshed the result while we waited
+            cached = self._cached_health(now)
+            if cached is not None:
+                return cached
+
+            result = await self._fetch_health()
+            if result.get("status") in HEALTHY_CLUSTER_STATUSES:
+                self._health_cache = (now, result)
+            return result
+
+    def _cached_health(self, now: float) -> dict[str, Any] | None:
+        """Get the last health result if it is still fresh.
+
+        Args:
+            now: Current monotonic time.
+
+        Returns:
+            Cached health result, or None if missing or stale.
+        """
+        if self._health_cache is None:
+            return None
+        checked_at, cached = self._health_cache
+        if now - checked_at < self.settings.elasticsearch_health_cache_seconds:
+            return cached
+        return None
+
+    async def _fetch_health(self) -> dict[str, Any]:
+        """Query cluster health from Elasticsearch.
+
         Returns:
             Dictionary containing health status or error info.
         """
         try:
             client = await self.get_client()
             response = await client.cluster.health()
-            result = dict(response)
+            result: dict[str, Any] = response.body
             logger.debug(
                 "elasticsearch_health_check",
                 status=result.get("status"),
@@ -88,7 +146,9 @@ class ElasticsearchClient:
     ) -> bool:
         """Connect to Elasticsearch with retry logic.
 
-        Uses exponential backoff between retries.
+        Uses capped exponential backoff between retries, with each delay
+        jittered to 50-150% so that workers starting together don't retry
+        in lockstep.
 
         Args:
             max_retries: Maximum number of connection attempts.
@@ -112,17 +172,22 @@ class ElasticsearchClient:
             except ESConnectionError:
                 pass
 
+            # No wait after the last attempt
+            if attempt == max_retries - 1:
+                break
+
+            # Jitter by +/-50%, then cap so the sleep itself never exceeds the max
+            sleep_for = min(
+                MAX_RETRY_DELAY_SECONDS, current_delay * (0.5 + random.random())
+            )
             logger.warning(
                 "elasticsearch_connection_retry",
                 attempt=attempt + 1,
                 max_retries=max_retries,
-                next_delay_seconds=current_delay,
+                next_delay_seconds=round(sleep_for, 2),
             )
-
-            # Wait before next attempt (except on last attempt)
-            if attempt < max_retries - 1:
-                await asyncio.sleep(current_delay)
-                current_delay *= 2  # Exponential backoff
+            await asyncio.sleep(sleep_for)
+            current_delay = min(current_delay * 2, MAX_RETRY_DELAY_SECONDS)
 
         # All retries failed - clean up
         logger.error(
@@ -140,14 +205,19 @@ class ElasticsearchClient:
             self._client = None
 
 
-@lru_cache
+_elasticsearch_client: ElasticsearchClient | None = None
+
+
 def get_elasticsearch_client() -> ElasticsearchClient:
     """Get a singleton ElasticsearchClient instance.
 
     Returns:
         Cached ElasticsearchClient instance.
     """
-    return ElasticsearchClient(get_settings())
+    global _elasticsearch_client  # noqa: PLW0603
+    if _elasticsearch_client is None:
+        _elasticsearch_client = ElasticsearchClient(get_settings())
+    return _elasticsearch_client
 
 
 async def wait_for_elasticsearch(max_retries: int = 5, delay: float = 1.0) -> bool:
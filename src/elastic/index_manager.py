@@ -1,8 +1,8 @@
 """Elasticsearch index management service."""
 
-from functools import lru_cache
 from typing import Any
 
+from elasticsearch import BadRequestError
 from elasticsearch import NotFoundError as ESNotFoundError
 
 from src.config.settings import Settings, get_settings
@@ -47,9 +47,6 @@ class IndexManager:
         Returns:
             Creation response or None if index already exists.
         """
-        if await self.index_exists():
-            return None
-
         es_client = await self.client.get_client()
 
         body: dict[str, Any] = {}
@@ -58,8 +55,14 @@ class IndexManager:
         if settings:
             body["settings"] = settings
 
-        response = await es_client.indices.create(index=self.index_name, **body)
-        return dict(response)
+        # Create directly and treat a conflict as "exists", saving an exists call
+        try:
+            response = await es_client.indices.create(index=self.index_name, **body)
+        except BadRequestError as e:
+            if e.error == "resource_already_exists_exception":
+                return None
+            raise
+        return response.body  # type: ignore[no-any-return]
 
     async def delete_index(self) -> dict[str, Any] | None:
         """Delete the configured index.
@@ -67,12 +70,12 @@ class IndexManager:
         Returns:
             Deletion response or None if index doesn't exist.
         """
-        if not await self.index_exists():
-            return None
-
         es_client = await self.client.get_client()
-        response = await es_client.indices.delete(index=self.index_name)
-        return dict(response)
+        try:
+            response = await es_client.indices.delete(index=self.index_name)
+        except ESNotFoundError:
+            return None
+        return response.body  # type: ignore[no-any-return]
 
     async def get_mapping(self) -> dict[str, Any] | None:
         """Get the index mappings.
@@ -83,7 +86,7 @@ class IndexManager:
         try:
             es_client = await self.client.get_client()
             response = await es_client.indices.get_mapping(index=self.index_name)
-            return dict(response)
+            return response.body  # type: ignore[no-any-return]
         except ESNotFoundError:
             return None
 
@@ -106,18 +109,20 @@ class IndexManager:
         Returns:
             True if index exists (created or already existed).
         """
-        if await self.index_exists():
-            return True
-
         await self.create_index(mappings=mappings, settings=settings)
         return True
 
 
-@lru_cache
+_index_manager: IndexManager | None = None
+
+
 def get_index_manager() -> IndexManager:
     """Get a singleton IndexManager instance.
 
     Returns:
         Cached IndexManager instance.
     """
-    return IndexManager(get_elasticsearch_client(), get_settings())
+    global _index_manager  # noqa: PLW0603
+    if _index_manager is None:
+        _index_manager = IndexManager(get_elasticsearch_client(), get_settings())
+    return _index_manager
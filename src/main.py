@@ -1,23 +1,18 @@
 """FastAPI application entry point."""
 
-import time
-import uuid
 from contextlib import asynccontextmanager
 from typing import Any
 
-from fastapi import FastAPI, Request
+from fastapi import FastAPI
+from fastapi.middleware.gzip import GZipMiddleware
 from slowapi.errors import RateLimitExceeded
 
 from src.api.routes.products import router as products_router
 from src.api.routes.search import router as search_router
 from src.config.settings import get_settings
 from src.core.exceptions import FindoraException, global_exception_handler
-from src.core.logging import (
-    bind_request_context,
-    clear_request_context,
-    get_logger,
-    setup_logging,
-)
+from src.core.logging import get_logger, setup_logging, shutdown_logging
+from src.core.middleware import RequestContextMiddleware
 from src.core.rate_limit import get_limiter, rate_limit_exceeded_handler
 from src.elastic.client import get_elasticsearch_client
 
@@ -34,16 +29,43 @@ async def lifespan(_app: FastAPI):  # type: ignore[no-untyped-def]
         _app: FastAPI application instance (required by lifespan signature).
     """
     # Startup
-    setup_logging(log_level=settings.log_level, log_format=settings.log_format)
+    setup_logging(
+        log_level=settings.log_level,
+        log_format=settings.log_format,
+        queue_size=settings.log_queue_size,
+    )
     logger.info(
         "application_startup",
         app_name=settings.app_name,
         version=settings.app_version,
         debug=settings.debug,
     )
-    yield
-    # Shutdown
-    logger.info("application_shutdown")
+    if settings.web_concurrency > 1:
+        warn_per_worker_state()
+    try:
+        yield
+    finally:
+        # Shutdown
+        logger.info("application_shutdown")
+        shutdown_logging()
+
+
+def warn_per_worker_state() -> None:
+    """Warn about state that isn't shared between worker processes."""
+    if settings.rate_limit_enabled and settings.redis_url is None:
+        # In-memory counters: each worker allows the full limit on its own
+        logger.warning(
+            "rate_limits_per_worker",
+            workers=settings.web_concurrency,
+            hint="set REDIS_URL to share rate limit counters between workers",
+        )
+    if settings.cache_enabled:
+        # A write only invalidates the cache of the worker that handled it
+        logger.warning(
+            "search_cache_per_worker",
+            workers=settings.web_concurrency,
+            max_staleness_seconds=settings.cache_ttl_seconds,
+        )
 
 
 app = FastAPI(
@@ -60,52 +82,15 @@ app.state.limiter = limiter
 app.add_exception_handler(FindoraException, global_exception_handler)
 app.add_exception_handler(RateLimitExceeded, rate_limit_exceeded_handler)  # type: ignore[arg-type]
 
+# Compress larger responses (search result pages) for clients that accept gzip
+app.add_middleware(
+    GZipMiddleware,
+    minimum_size=settings.gzip_minimum_size,
+    compresslevel=settings.gzip_compresslevel,
+)
 
-@app.middleware("http")
-async def request_middleware(request: Request, call_next):  # type: ignore[no-untyped-def]
-    """Middleware for request tracking and logging."""
-    # Generate unique request ID
-    request_id = str(uuid.uuid4())[:8]
-    request.state.request_id = request_id
-
-    # Bind request context for logging
-    bind_request_context(
-        request_id=request_id,
-        method=request.method,
-        path=str(request.url.path),
-    )
-
-    # Track request timing
-    start_time = time.perf_counter()
-
-    try:
-        response = await call_next(request)
-
-        # Calculate duration
-        duration_ms = (time.perf_counter() - start_time) * 1000
-
-        # Log request completion
-        logger.info(
-            "request_completed",
-            status_code=response.status_code,
-            duration_ms=round(duration_ms, 2),
-        )
-
-        # Add request ID to response headers
-        response.headers["X-Request-ID"] = request_id
-
-        return response
-    except Exception:
-        # Log unhandled exceptions (let them propagate for default handling)
-        logger.exception(
-            "unhandled_exception",
-            path=str(request.url.path),
-            method=request.method,
-        )
-        raise
-    finally:
-        clear_request_context()
-
+# Request IDs, log context and access logging (outermost, so it sees every response)
+app.add_middleware(RequestContextMiddleware)
 
 # Include routers
 app.include_router(search_router)
@@ -117,16 +102,13 @@ async def health_check() -> dict[str, Any]:
     """Health check endpoint with Elasticsearch status."""
     es_client = get_elasticsearch_client()
 
-    # Check Elasticsearch connectivity
-    es_connected = await es_client.ping()
+    # A single cluster health call also tells us whether ES is reachable
     es_health = await es_client.health_check()
+    cluster_status = es_health.get("status", "unavailable")
+    es_connected = cluster_status != "unavailable"
 
     # Determine overall status
-    cluster_status = es_health.get("status", "unavailable")
-    if es_connected and cluster_status in ("green", "yellow"):
-        overall_status = "healthy"
-    else:
-        overall_status = "degraded"
+    overall_status = "healthy" if cluster_status in ("green", "yellow") else "degraded"
 
     return {
         "status": overall_status,
@@ -1,9 +1,22 @@
 """Product models and search schemas."""
 
 from enum import Enum
-from typing import Any
+from typing import Any, Literal
 
-from pydantic import BaseModel, Field
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    computed_field,
+    field_validator,
+    model_validator,
+)
+
+# Product IDs are generated UUIDs or seeded short IDs. The same constraint
+# applies to request bodies and to the /products/{product_id} path, so every
+# ID that can be indexed can also be fetched, updated and deleted.
+PRODUCT_ID_MAX_LENGTH = 64
+PRODUCT_ID_PATTERN = r"^[A-Za-z0-9_-]+$"
 
 
 class SortField(str, Enum):
@@ -24,7 +37,15 @@ class SortOrder(str, Enum):
 class Product(BaseModel):
     """Product model for Elasticsearch documents."""
 
-    id: str = Field(..., description="Unique product identifier")
+    model_config = ConfigDict(frozen=True)
+
+    id: str = Field(
+        ...,
+        min_length=1,
+        max_length=PRODUCT_ID_MAX_LENGTH,
+        pattern=PRODUCT_ID_PATTERN,
+        description="Unique product identifier",
+    )
     name: str = Field(..., min_length=1, description="Product name")
     description: str = Field(..., min_length=1, description="Product description")
     price: float = Field(..., gt=0, description="Product price (must be positive)")
@@ -40,7 +61,9 @@ class SearchQuery(BaseModel):
     size: int = Field(default=10, ge=1, le=100, description="Results per page")
     min_price: float | None = Field(default=None, description="Minimum price filter")
     max_price: float | None = Field(default=None, description="Maximum price filter")
-    category: str | None = Field(default=None, description="Single category filter")
+    category: str | None = Field(
+        default=None, description="Single category filter (ignored with categories)"
+    )
     categories: list[str] | None = Field(
         default=None, description="Multiple categories filter (OR logic)"
     )
@@ -51,6 +74,35 @@ class SearchQuery(BaseModel):
         default=SortOrder.DESC, description="Sort order (asc/desc)"
     )
 
+    @field_validator("categories")
+    @classmethod
+    def dedupe_categories(cls, value: list[str] | None) -> list[str] | None:
+        """Drop repeated categories, keeping first-seen order.
+
+        Args:
+            value: Requested categories.
+
+        Returns:
+            Unique categories, or None if none were given.
+        """
+        if not value:
+            return None
+        return list(dict.fromkeys(value))
+
+    @model_validator(mode="after")
+    def merge_category(self) -> "SearchQuery":
+        """Fold a single ``category`` into ``categories``.
+
+        Downstream code only has to look at ``categories``; when both are
+        given, ``categories`` takes precedence.
+
+        Returns:
+            The validated query.
+        """
+        if self.categories is None and self.category is not None:
+            self.categories = [self.category]
+        return self
+
 
 class SearchResult(Product):
     """Search result with relevance score and highlights."""
@@ -60,22 +112,71 @@ class SearchResult(Product):
         default=None, description="Highlighted matching text fragments"
     )
 
+    @classmethod
+    def from_es_hit(cls, hit: dict[str, Any]) -> "SearchResult":
+        """Build a result from an Elasticsearch search hit.
+
+        Hits come from documents that were validated when indexed, so the
+        result is constructed without running validation again. Numbers
+        are the one exception: ``_source`` returns them as stored (a price
+        indexed as ``5`` comes back as an int), so they are cast to float.
+
+        Args:
+            hit: A single entry of the response's ``hits.hits``.
+
+        Returns:
+            SearchResult for the hit.
+        """
+        source = hit["_source"]
+        return cls.model_construct(
+            id=hit["_id"],
+            name=source["name"],
+            description=source["description"],
+            price=float(source["price"]),
+            category=source.get("category"),
+            # When sorting by non-relevance fields, _score may be None
+            score=float(hit.get("_score") or 0.0),
+            highlights=hit.get("highlight"),
+        )
+
 
 class SearchResponse(BaseModel):
     """Search response with results and pagination."""
 
     query: str = Field(..., description="Original search query")
     total: int = Field(..., ge=0, description="Total number of matching documents")
+    total_relation: Literal["eq", "gte"] = Field(
+        default="eq",
+        description="'eq' if total is exact, 'gte' if it is a lower bound",
+    )
     page: int = Field(..., ge=1, description="Current page number")
     size: int = Field(..., ge=1, description="Results per page")
-    total_pages: int = Field(..., ge=0, description="Total number of pages")
-    has_next: bool = Field(..., description="Whether there is a next page")
-    has_previous: bool = Field(..., description="Whether there is a previous page")
     results: list[SearchResult] = Field(
         default_factory=list, description="Search results"
     )
     took_ms: int | None = Field(default=None, description="Query execution time in ms")
 
+    # Pagination metadata is derived from total/page/size, so it can't drift
+    # from them and callers don't have to compute it
+
+    @computed_field  # type: ignore[prop-decorator]
+    @property
+    def total_pages(self) -> int:
+        """Total number of pages."""
+        return (self.total + self.size - 1) // self.size
+
+    @computed_field  # type: ignore[prop-decorator]
+    @property
+    def has_next(self) -> bool:
+        """Whether there is a next page."""
+        return self.page < self.total_pages
+
+    @computed_field  # type: ignore[prop-decorator]
+    @property
+    def has_previous(self) -> bool:
+        """Whether there is a previous page."""
+        return self.page > 1
+
 
 class ProductCreate(BaseModel):
     """Schema for creating a new product."""
@@ -1,11 +1,14 @@
 """Business logic services."""
 
+from src.services.cache import SearchCache, get_search_cache
 from src.services.indexing import IndexingService, get_indexing_service
 from src.services.search import SearchService, get_search_service
 
 __all__ = [
     "IndexingService",
+    "SearchCache",
     "SearchService",
     "get_indexing_service",
+    "get_search_cache",
     "get_search_service",
 ]
@@ -0,0 +1,229 @@
+"""In-memory TTL cache for search responses."""
+
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any
+
+from src.config.settings import get_settings
+from src.models.product import SearchResponse
+
+# Hashable tuple of normalized search parameters
+CacheKey = tuple[Any, ...]
+
+
+@dataclass(slots=True)
+class CacheEntry:
+    """A cached search response with its expiry time."""
+
+    value: SearchResponse
+    expires_at: float
+
+
+class FrequencySketch:
+    """Count-Min Sketch of approximate key frequencies (TinyLFU).
+
+    Keeps ``depth`` rows of 4-bit saturating counters. Once ``10 * width``
+    increments have been recorded, every counter is halved so the sketch
+    tracks recent popularity rather than all-time totals.
+    """
+
+    _MAX_COUNT = 15
+    _DEPTH = 4
+
+    def __init__(self, capacity: int) -> None:
+        """Initialize the sketch.
+
+        Args:
+            capacity: Number of entries in the cache the sketch guards.
+        """
+        width = 64
+        while width < capacity * 4:
+            width <<= 1
+        self._mask = width - 1
+        self._rows = [bytearray(width) for _ in range(self._DEPTH)]
+        self._additions = 0
+        self._sample_size = width * 10
+
+    def _indexes(self, key: CacheKey) -> list[int]:
+        """Get the counter index of a key in each row."""
+        h = hash(key)
+        return [hash((row, h)) & self._mask for row in range(self._DEPTH)]
+
+    def increment(self, key: CacheKey) -> None:
+        """Record one occurrence of a key.
+
+        Args:
+            key: Cache key that was requested.
+        """
+        for row, index in zip(self._rows, self._indexes(key), strict=True):
+            if row[index] < self._MAX_COUNT:
+                row[index] += 1
+
+        self._additions += 1
+        if self._additions >= self._sample_size:
+            self._age()
+
+    def estimate(self, key: CacheKey) -> int:
+        """Estimate how often a key has been requested recently.
+
+        Args:
+            key: Cache key to look up.
+
+        Returns:
+            Upper-bound estimate of the key's recent frequency.
+        """
+        return min(
+            row[index]
+            for row, index in zip(self._rows, self._indexes(key), strict=True)
+        )
+
+    def _age(self) -> None:
+        """Halve every counter."""
+        self._rows = [bytearray(count >> 1 for count in row) for row in self._rows]
+        self._additions //= 2
+
+
+class SearchCache:
+    """Bounded, per-process LRU cache with a TTL for search responses.
+
+    Entries are kept in recency order: hits move to the end, and the least
+    recently used entry is evicted in O(1) when the cache is full. Expired
+    entries are dropped on lookup, and any expired run at the LRU end is
+    purged on insert.
+
+    Admission is filtered with TinyLFU: every lookup is counted in a
+    frequency sketch, and once the cache is full a new response only
+    replaces the LRU victim if its key has been requested more often
+    recently. A burst of one-shot queries therefore can't flush hot entries.
+    """
+
+    def __init__(
+        self,
+        max_size: int,
+        ttl_seconds: float,
+    ) -> None:
+        """Initialize the cache.
+
+        Args:
+            max_size: Maximum number of cached responses.
+            ttl_seconds: Time-to-live for each cached response.
+        """
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self._cache: OrderedDict[CacheKey, CacheEntry] = OrderedDict()
+        self._sketch = FrequencySketch(max_size)
+        self._hits = 0
+        self._misses = 0
+        # Bumped by clear(); lets a search started before an invalidation
+        # skip caching the response it got from the older index state
+        self.generation = 0
+
+    def __len__(self) -> int:
+        """Return the number of cached entries (including expired ones)."""
+        return len(self._cache)
+
+    def get(self, key: CacheKey) -> SearchResponse | None:
+        """Get a cached response.
+
+        Args:
+            key: Cache key for the search parameters.
+
+        Returns:
+            Cached SearchResponse, or None if missing or expired.
+        """
+        self._sketch.increment(key)
+        entry = self._cache.get(key)
+
+        if entry is None:
+            self._misses += 1
+            return None
+
+        if time.monotonic() >= entry.expires_at:
+            del self._cache[key]
+            self._misses += 1
+            return None
+
+        self._cache.move_to_end(key)
+        self._hits += 1
+        return entry.value
+
+    def set(
+        self, key: CacheKey, value: SearchResponse, generation: int | None = None
+    ) -> None:
+        """Offer a response to the cache.
+
+        When the cache is full, the response is only stored if its key is
+        estimated to be more popular than the least recently used entry.
+
+        Args:
+            key: Cache key for the search parameters.
+            value: SearchResponse to cache.
+            generation: Cache generation read before the search was sent.
+                The response is dropped if the cache was cleared since.
+        """
+        if generation is not None and generation != self.generation:
+            return
+
+        now = time.monotonic()
+
+        self._purge_expired(now)
+
+        if key in self._cache:
+            self._cache.move_to_end(key)
+        elif len(self._cache) >= self.max_size:
+            victim = next(iter(self._cache))
+            if self._sketch.estimate(key) <= self._sketch.estimate(victim):
+                return
+            del self._cache[victim]
+
+        self._cache[key] = CacheEntry(value=value, expires_at=now + self.ttl_seconds)
+
+    def _purge_expired(self, now: float) -> None:
+        """Drop expired entries from the least recently used end.
+
+        Args:
+            now: Current monotonic time.
+        """
+        while self._cache:
+            key = next(iter(self._cache))
+            if self._cache[key].expires_at > now:
+                break
+            del self._cache[key]
+
+    def clear(self) -> None:
+        """Remove all cached entries and start a new generation."""
+        self._cache.clear()
+        self.generation += 1
+
+    def stats(self) -> dict[str, int]:
+        """Get cache statistics.
+
+        Returns:
+            Dictionary with size, hits, and misses.
+        """
+        return {
+            "size": len(self._cache),
+            "max_size": self.max_size,
+            "hits": self._hits,
+            "misses": self._misses,
+        }
+
+
+_search_cache: SearchCache | None = None
+
+
+def get_search_cache() -> SearchCache:
+    """Get a singleton SearchCache instance.
+
+    Returns:
+        Cached SearchCache instance.
+    """
+    global _search_cache  # noqa: PLW0603
+    if _search_cache is None:
+        settings = get_settings()
+        _search_cache = SearchCache(
+            max_size=settings.cache_max_size,
+            ttl_seconds=settings.cache_ttl_seconds,
+        )
+    return _search_cache
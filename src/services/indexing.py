@@ -1,32 +1,50 @@
 """Indexing service for Elasticsearch document operations."""
 
-from functools import lru_cache
+from collections.abc import Iterable
 from typing import Any
 
 from elasticsearch import NotFoundError as ESNotFoundError
-from elasticsearch.helpers import async_bulk
+from elasticsearch.helpers import async_streaming_bulk
 
 from src.config.settings import Settings, get_settings
 from src.core.logging import get_logger
 from src.elastic.client import ElasticsearchClient, get_elasticsearch_client
 from src.models.product import BulkOperationResult, Product
+from src.services.cache import SearchCache, get_search_cache
 
 logger = get_logger(__name__)
 
+# The product id is the document _id, not part of the stored _source
+_SOURCE_EXCLUDE = {"id"}
+
 
 class IndexingService:
     """Service for indexing and managing documents in Elasticsearch."""
 
-    def __init__(self, client: ElasticsearchClient, settings: Settings) -> None:
+    def __init__(
+        self,
+        client: ElasticsearchClient,
+        settings: Settings,
+        cache: SearchCache | None = None,
+    ) -> None:
         """Initialize the indexing service.
 
         Args:
             client: ElasticsearchClient instance.
             settings: Application settings.
+            cache: Optional search response cache to invalidate on writes.
         """
         self.client = client
         self.settings = settings
         self.index_name = settings.elasticsearch_index
+        self.cache = cache
+        # With a search cache, single-document writes wait for the refresh
+        # that makes them searchable before the cache is cleared; otherwise a
+        # search landing in between would cache pre-write results for the
+        # whole TTL. Bulk writes refresh once at the end instead.
+        self._write_options: dict[str, Any] = (
+            {"refresh": "wait_for"} if cache is not None else {}
+        )
 
     async def index_product(self, product: Product) -> dict[str, Any]:
         """Index a single product.
@@ -40,13 +58,15 @@ class IndexingService:
         es_client = await self.client.get_client()
 
         # Convert product to document (exclude id from body, use as doc id)
-        document = product.model_dump(exclude={"id"})
+        document = product.model_dump(exclude=_SOURCE_EXCLUDE)
 
         response = await es_client.index(
             index=self.index_name,
             id=product.id,
             document=document,
+            **self._write_options,
         )
+        self._invalidate_cache()
 
         logger.debug(
             "product_indexed",
@@ -55,7 +75,7 @@ class IndexingService:
             result=response.get("result"),
         )
 
-        return dict(response)
+        return response.body  # type: ignore[no-any-return]
 
     async def delete_product(self, product_id: str) -> dict[str, Any] | None:
         """Delete a product by ID.
@@ -71,13 +91,15 @@ class IndexingService:
             response = await es_client.delete(
                 index=self.index_name,
                 id=product_id,
+                **self._write_options,
             )
+            self._invalidate_cache()
             logger.debug(
                 "product_deleted_from_index",
                 product_id=product_id,
                 index=self.index_name,
             )
-            return dict(response)
+            return response.body  # type: ignore[no-any-return]
         except ESNotFoundError:
             logger.debug(
                 "product_not_found_for_delete",
@@ -138,40 +160,28 @@ class IndexingService:
                 errors=[],
             )
 
-        es_client = await self.client.get_client()
-
-        # Generate bulk actions
-        actions = [
+        # Actions are generated lazily, chunk by chunk, as the bulk helper sends
+        actions = (
             {
                 "_index": self.index_name,
                 "_id": product.id,
-                "_source": product.model_dump(exclude={"id"}),
+                "_source": product.model_dump(exclude=_SOURCE_EXCLUDE),
             }
             for product in products
-        ]
-
-        success_count, errors = await async_bulk(
-            es_client,
-            actions,
-            raise_on_error=False,
         )
 
-        # errors can be int (count mode) or list (actual errors)
-        error_list = errors if isinstance(errors, list) else []
+        result = await self._run_bulk(actions)
+        await self._refresh_and_invalidate_cache()
 
         logger.debug(
             "bulk_index_completed",
             total=len(products),
-            success_count=success_count,
-            error_count=len(error_list),
+            success_count=result.success_count,
+            error_count=result.error_count,
             index=self.index_name,
         )
 
-        return BulkOperationResult(
-            success_count=success_count,
-            error_count=len(error_list),
-            errors=error_list,
-        )
+        return result
 
     async def bulk_delete_products(self, product_ids: list[str]) -> BulkOperationResult:
         """Bulk delete multiple products.
@@ -189,47 +199,99 @@ class IndexingService:
                 errors=[],
             )
 
-        es_client = await self.client.get_client()
-
         # Generate bulk delete actions
-        actions = [
+        actions = (
             {
                 "_op_type": "delete",
                 "_index": self.index_name,
                 "_id": product_id,
             }
             for product_id in product_ids
-        ]
-
-        success_count, errors = await async_bulk(
-            es_client,
-            actions,
-            raise_on_error=False,
         )
 
-        # errors can be int (count mode) or list (actual errors)
-        error_list = errors if isinstance(errors, list) else []
+        result = await self._run_bulk(actions)
+        await self._refresh_and_invalidate_cache()
 
         logger.debug(
             "bulk_delete_completed",
             total=len(product_ids),
-            success_count=success_count,
-            error_count=len(error_list),
+            success_count=result.success_count,
+            error_count=result.error_count,
             index=self.index_name,
         )
 
+        return result
+
+    async def _run_bulk(self, actions: Iterable[dict[str, Any]]) -> BulkOperationResult:
+        """Send actions through the bulk API and tally the outcome.
+
+        Items are consumed as each chunk completes, and only the first
+        ``bulk_max_reported_errors`` failures are kept, so a pathological
+        run doesn't accumulate one error dict per document.
+
+        Args:
+            actions: Bulk actions to send.
+
+        Returns:
+            BulkOperationResult with success/error counts.
+        """
+        es_client = await self.client.get_client()
+        max_reported = self.settings.bulk_max_reported_errors
+
+        success_count = 0
+        error_count = 0
+        errors: list[dict[str, Any]] = []
+        async for ok, item in async_streaming_bulk(
+            es_client,
+            actions,
+            raise_on_error=False,
+            chunk_size=self.settings.bulk_chunk_size,
+            max_chunk_bytes=self.settings.bulk_max_chunk_bytes,
+            max_retries=self.settings.bulk_max_retries,
+        ):
+            if ok:
+                success_count += 1
+            else:
+                error_count += 1
+                if len(errors) < max_reported:
+                    errors.append(item)
+
         return BulkOperationResult(
             success_count=success_count,
-            error_count=len(error_list),
-            errors=error_list,
+            error_count=error_count,
+            errors=errors,
         )
 
+    async def _refresh_and_invalidate_cache(self) -> None:
+        """Make a finished bulk write searchable, then drop cached responses.
+
+        One explicit refresh replaces refresh=wait_for on every bulk chunk,
+        which would stall each chunk for up to a refresh interval.
+        """
+        if self.cache is None:
+            return
+        es_client = await self.client.get_client()
+        await es_client.indices.refresh(index=self.index_name)
+        self.cache.clear()
+
+    def _invalidate_cache(self) -> None:
+        """Drop cached search responses after the index has changed."""
+        if self.cache is not None:
+            self.cache.clear()
+
+
+_indexing_service: IndexingService | None = None
+
 
-@lru_cache
 def get_indexing_service() -> IndexingService:
     """Get a singleton IndexingService instance.
 
     Returns:
         Cached IndexingService instance.
     """
-    return IndexingService(get_elasticsearch_client(), get_settings())
+    global _indexing_service  # noqa: PLW0603
+    if _indexing_service is None:
+        settings = get_settings()
+        cache = get_search_cache() if settings.cache_enabled else None
+        _indexing_service = IndexingService(get_elasticsearch_client(), settings, cache)
+    return _indexing_service
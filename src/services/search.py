@@ -1,6 +1,6 @@
 """Search service for Elasticsearch queries."""
 
-from functools import lru_cache
+import logging
 from typing import Any
 
 from src.config.settings import Settings, get_settings
@@ -12,23 +12,69 @@ from src.models.product import (
     SearchResult,
     SortField,
 )
+from src.services.cache import CacheKey, SearchCache, get_search_cache
 
 logger = get_logger(__name__)
 
+# Query strings that mean "browse everything" rather than search for terms
+_BROWSE_QUERIES = frozenset({"", "*"})
+
+# Static request fragments, shared across requests (the client only reads them)
+_SEARCH_FIELDS = ["name^2", "description"]  # boost name field
+_HIGHLIGHT: dict[str, Any] = {
+    "fields": {
+        "name": {},
+        "description": {},
+    },
+    "pre_tags": ["<em>"],
+    "post_tags": ["</em>"],
+}
+
+# Only the fields SearchResult is built from
+_SOURCE_FIELDS = ["name", "description", "price", "category"]
+
+# Strip response metadata (_index, _shards, max_score, ...) that isn't parsed
+_FILTER_PATH = [
+    "took",
+    "hits.total.value",
+    "hits.total.relation",
+    "hits.hits._id",
+    "hits.hits._score",
+    "hits.hits._source",
+    "hits.hits.highlight",
+]
+
+# Index order, for requests where every hit has the same score
+_DOC_ORDER_SORT: list[dict[str, Any]] = [{"_doc": {"order": "asc"}}]
+
+# Elasticsearch field for each explicit sort option (relevance uses _score)
+_SORT_FIELDS: dict[SortField, str] = {
+    SortField.PRICE: "price",
+    # Use .keyword for exact sorting on text fields
+    SortField.NAME: "name.keyword",
+}
+
 
 class SearchService:
     """Service for executing search queries against Elasticsearch."""
 
-    def __init__(self, client: ElasticsearchClient, settings: Settings) -> None:
+    def __init__(
+        self,
+        client: ElasticsearchClient,
+        settings: Settings,
+        cache: SearchCache | None = None,
+    ) -> None:
         """Initialize the search service.
 
         Args:
             client: ElasticsearchClient instance.
             settings: Application settings.
+            cache: Optional response cache. Caching is disabled if None.
         """
         self.client = client
         self.settings = settings
         self.index_name = settings.elasticsearch_index
+        self.cache = cache
 
     async def search(self, query: SearchQuery) -> SearchResponse:
         """Execute a search query.
@@ -39,6 +85,23 @@ class SearchService:
         Returns:
             SearchResponse with results and metadata.
         """
+        # The filtering logger makes debug() a no-op below its level, but the
+        # keyword arguments are still built; skip that on the hot path too
+        debug = logger.is_enabled_for(logging.DEBUG)
+
+        cache_key: CacheKey | None = None
+        generation = 0
+        if self.cache is not None:
+            cache_key = self._cache_key(query)
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                if debug:
+                    logger.debug("search_cache_hit", query=query.q)
+                return cached
+            # Read before the search is sent, so a write that invalidates the
+            # cache while it is in flight keeps this response out of it
+            generation = self.cache.generation
+
         es_client = await self.client.get_client()
 
         # Build the query
@@ -56,36 +119,73 @@ class SearchService:
             "query": es_query,
             "from_": from_,
             "size": query.size,
-            "highlight": self._build_highlight(),
+            "highlight": _HIGHLIGHT,
+            "source": _SOURCE_FIELDS,
+            "filter_path": _FILTER_PATH,
+            # Stop counting once the total is large enough to paginate past
+            # this page; has_next stays accurate either way
+            "track_total_hits": max(
+                self.settings.search_track_total_hits, from_ + query.size + 1
+            ),
         }
 
         # Only add sort if not sorting by relevance (default ES behavior)
         if sort:
             search_params["sort"] = sort
 
-        logger.debug(
-            "executing_search",
-            query=query.q,
-            fuzzy=query.fuzzy,
-            page=query.page,
-            size=query.size,
-            index=self.index_name,
-        )
+        if debug:
+            logger.debug(
+                "executing_search",
+                query=query.q,
+                fuzzy=query.fuzzy,
+                page=query.page,
+                size=query.size,
+                index=self.index_name,
+            )
 
         es_response = await es_client.search(**search_params)
 
         # Parse results
-        result = self._parse_response(query, dict(es_response))
+        result = self._parse_response(query, es_response.body)
+
+        if debug:
+            logger.debug(
+                "search_completed",
+                query=query.q,
+                total_hits=result.total,
+                took_ms=result.took_ms,
+            )
 
-        logger.debug(
-            "search_completed",
-            query=query.q,
-            total_hits=result.total,
-            took_ms=result.took_ms,
-        )
+        if self.cache is not None and cache_key is not None:
+            self.cache.set(cache_key, result, generation)
 
         return result
 
+    def _cache_key(self, query: SearchQuery) -> CacheKey:
+        """Build a hashable cache key from the search parameters.
+
+        Equivalent queries share a key: a single ``category`` is already folded
+        into ``categories``, and categories are sorted since the OR filter
+        doesn't depend on their order.
+
+        Args:
+            query: Search query parameters.
+
+        Returns:
+            Tuple uniquely identifying the query.
+        """
+        return (
+            query.q,
+            query.fuzzy,
+            query.page,
+            query.size,
+            query.min_price,
+            query.max_price,
+            tuple(sorted(query.categories)) if query.categories else None,
+            query.sort_by,
+            query.sort_order,
+        )
+
     def _build_query(self, query: SearchQuery) -> dict[str, Any]:
         """Build Elasticsearch query from SearchQuery.
 
@@ -95,19 +195,27 @@ class SearchService:
         Returns:
             Elasticsearch query dict.
         """
+        filters = self._build_filters(query)
+
+        # Browsing has no terms to score: filter (or match everything) with a
+        # constant score so no BM25 work is done
+        if _is_browse(query):
+            if filters:
+                return {"constant_score": {"filter": {"bool": {"filter": filters}}}}
+            return {"match_all": {}}
+
         # Base multi_match query
         multi_match: dict[str, Any] = {
             "query": query.q,
-            "fields": ["name^2", "description"],  # boost name field
+            "fields": _SEARCH_FIELDS,
             "type": "best_fields",
         }
 
         # Add fuzziness if enabled
         if query.fuzzy:
             multi_match["fuzziness"] = "AUTO"
-
-        # Check if we need filters
-        filters = self._build_filters(query)
+            multi_match["prefix_length"] = self.settings.search_fuzzy_prefix_length
+            multi_match["max_expansions"] = self.settings.search_fuzzy_max_expansions
 
         if filters:
             # Use bool query with must + filter
@@ -130,19 +238,16 @@ class SearchService:
         Returns:
             List of sort clauses or None for relevance sorting.
         """
-        # Relevance sorting uses default ES behavior (no explicit sort)
-        if query.sort_by == SortField.RELEVANCE:
+        field = _SORT_FIELDS.get(query.sort_by)
+        if field is None:
+            # Browse results all score the same, so index order is as good as
+            # relevance and is the cheapest order to collect
+            if _is_browse(query):
+                return _DOC_ORDER_SORT
+            # Relevance sorting uses default ES behavior (no explicit sort)
             return None
 
-        order = query.sort_order.value
-
-        if query.sort_by == SortField.PRICE:
-            return [{"price": {"order": order}}]
-        elif query.sort_by == SortField.NAME:
-            # Use .keyword for exact sorting on text fields
-            return [{"name.keyword": {"order": order}}]
-
-        return None
+        return [{field: {"order": query.sort_order.value}}]
 
     def _build_filters(self, query: SearchQuery) -> list[dict[str, Any]]:
         """Build filter clauses for the query.
@@ -164,30 +269,12 @@ class SearchService:
                 price_range["lte"] = query.max_price
             filters.append({"range": {"price": price_range}})
 
-        # Multi-category filter (OR logic) takes precedence
+        # Category filter (OR logic); a single category is folded in here
         if query.categories:
             filters.append({"terms": {"category": query.categories}})
-        # Single category filter (backwards compatible)
-        elif query.category is not None:
-            filters.append({"term": {"category": query.category}})
 
         return filters
 
-    def _build_highlight(self) -> dict[str, Any]:
-        """Build highlight configuration.
-
-        Returns:
-            Highlight configuration dict.
-        """
-        return {
-            "fields": {
-                "name": {},
-                "description": {},
-            },
-            "pre_tags": ["<em>"],
-            "post_tags": ["</em>"],
-        }
-
     def _parse_response(
         self, query: SearchQuery, response: dict[str, Any]
     ) -> SearchResponse:
@@ -201,48 +288,48 @@ class SearchService:
             Parsed SearchResponse.
         """
         hits = response["hits"]
-        total = hits["total"]["value"]
+        total = hits["total"]
         took = response.get("took", 0)
 
-        # Calculate pagination metadata
-        total_pages = (total + query.size - 1) // query.size if total > 0 else 0
-        has_next = query.page < total_pages
-        has_previous = query.page > 1
-
-        results: list[SearchResult] = []
-        for hit in hits["hits"]:
-            source = hit["_source"]
-            # When sorting by non-relevance fields, _score may be None
-            score = hit.get("_score") or 0.0
-            result = SearchResult(
-                id=hit["_id"],
-                name=source["name"],
-                description=source["description"],
-                price=source["price"],
-                category=source.get("category"),
-                score=score,
-                highlights=hit.get("highlight"),
-            )
-            results.append(result)
+        # filter_path drops hits.hits entirely when nothing matched
+        results = [SearchResult.from_es_hit(hit) for hit in hits.get("hits", ())]
 
-        return SearchResponse(
+        # Inputs are a validated SearchQuery and already-built results
+        return SearchResponse.model_construct(
             query=query.q,
-            total=total,
+            total=total["value"],
+            total_relation=total.get("relation", "eq"),
             page=query.page,
             size=query.size,
-            total_pages=total_pages,
-            has_next=has_next,
-            has_previous=has_previous,
             results=results,
             took_ms=took,
         )
 
 
-@lru_cache
+def _is_browse(query: SearchQuery) -> bool:
+    """Check whether a query lists products rather than searching for terms.
+
+    Args:
+        query: Search query parameters.
+
+    Returns:
+        True for a blank or ``*`` query string.
+    """
+    return query.q.strip() in _BROWSE_QUERIES
+
+
+_search_service: SearchService | None = None
+
+
 def get_search_service() -> SearchService:
     """Get a singleton SearchService instance.
 
     Returns:
         Cached SearchService instance.
     """
-    return SearchService(get_elasticsearch_client(), get_settings())
+    global _search_service  # noqa: PLW0603
+    if _search_service is None:
+        settings = get_settings()
+        cache = get_search_cache() if settings.cache_enabled else None
+        _search_service = SearchService(get_elasticsearch_client(), settings, cache)
+    return _search_service
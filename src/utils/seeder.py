@@ -125,15 +125,12 @@ async def create_index_with_mappings() -> bool:
     """
     index_manager = get_index_manager()
 
-    if await index_manager.index_exists():
-        return False
-
-    await index_manager.create_index(
+    response = await index_manager.create_index(
         mappings=PRODUCT_MAPPINGS,
         settings=get_product_settings(),
     )
 
-    return True
+    return response is not None
 
 
 async def seed_sample_data() -> int:
@@ -175,9 +172,8 @@ async def clear_all_data() -> bool:
     """
     index_manager = get_index_manager()
 
-    # Delete existing index
-    if await index_manager.index_exists():
-        await index_manager.delete_index()
+    # Delete existing index (no-op if it doesn't exist)
+    await index_manager.delete_index()
 
     # Recreate with mappings
     await index_manager.create_index(
@@ -1,9 +1,11 @@
 """Pytest configuration and shared fixtures."""
 
-from collections.abc import AsyncGenerator
+from collections.abc import AsyncGenerator, Callable
 from typing import Any
+from unittest.mock import MagicMock
 
 import pytest
+from elastic_transport import ObjectApiResponse
 from httpx import ASGITransport, AsyncClient
 
 from src.config.settings import Settings, get_settings
@@ -85,3 +87,18 @@ def sample_products() -> list[dict[str, Any]]:
             "price": 699.99,
         },
     ]
+
+
+# ============================================================================
+# Elasticsearch Fixtures
+# ============================================================================
+
+
+@pytest.fixture
+def es_response() -> Callable[[dict[str, Any]], ObjectApiResponse[Any]]:
+    """Provide a helper wrapping bodies the way the Elasticsearch client does."""
+
+    def wrap(body: dict[str, Any]) -> ObjectApiResponse[Any]:
+        return ObjectApiResponse(body=body, meta=MagicMock())
+
+    return wrap
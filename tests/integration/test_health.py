@@ -116,3 +116,20 @@ class TestHealthEndpoint:
 
             assert response.status_code == 200
             assert data["elasticsearch"]["cluster_status"] == "yellow"
+
+    async def test_health_check_makes_single_elasticsearch_call(
+        self, async_client: AsyncClient
+    ) -> None:
+        """Test that health is derived from cluster health without a ping."""
+        with patch("src.main.get_elasticsearch_client") as mock_get_client:
+            mock_client = AsyncMock()
+            mock_client.health_check = AsyncMock(
+                return_value={"status": "green", "number_of_nodes": 1}
+            )
+            mock_get_client.return_value = mock_client
+
+            response = await async_client.get("/health")
+
+            assert response.json()["elasticsearch"]["connected"] is True
+            mock_client.health_check.assert_awaited_once()
+            mock_client.ping.assert_not_called()
@@ -1,5 +1,6 @@
 """Integration tests for indexing API endpoints."""
 
+import uuid
 from unittest.mock import AsyncMock, patch
 
 import pytest
@@ -37,13 +38,13 @@ class TestProductsEndpoint:
         self, async_client: AsyncClient, sample_product_data: dict
     ) -> None:
         """Test that creating a product returns 201."""
-        with patch("src.api.routes.products.get_indexing_service") as mock_service:
-            mock_instance = AsyncMock()
+        with patch(
+            "src.api.routes.products.indexing_service", new_callable=AsyncMock
+        ) as mock_instance:
             mock_instance.index_product = AsyncMock(
                 return_value={"result": "created", "_id": "1"}
             )
             mock_instance.index_name = "test_products"
-            mock_service.return_value = mock_instance
 
             response = await async_client.post(
                 "/api/v1/products", json=sample_product_data
@@ -55,13 +56,13 @@ class TestProductsEndpoint:
         self, async_client: AsyncClient, sample_product_data: dict
     ) -> None:
         """Test that create product returns correct format."""
-        with patch("src.api.routes.products.get_indexing_service") as mock_service:
-            mock_instance = AsyncMock()
+        with patch(
+            "src.api.routes.products.indexing_service", new_callable=AsyncMock
+        ) as mock_instance:
             mock_instance.index_product = AsyncMock(
                 return_value={"result": "created", "_id": "abc123"}
             )
             mock_instance.index_name = "test_products"
-            mock_service.return_value = mock_instance
 
             response = await async_client.post(
                 "/api/v1/products", json=sample_product_data
@@ -72,6 +73,30 @@ class TestProductsEndpoint:
             assert "result" in data
             assert data["result"] == "created"
 
+    async def test_create_product_generates_uuid4_id(
+        self, async_client: AsyncClient, sample_product_data: dict
+    ) -> None:
+        """Test that created products get unique RFC 4122 version 4 IDs."""
+        with patch(
+            "src.api.routes.products.indexing_service", new_callable=AsyncMock
+        ) as mock_instance:
+            mock_instance.index_product = AsyncMock(return_value={"result": "created"})
+            mock_instance.index_name = "test_products"
+
+            first = await async_client.post(
+                "/api/v1/products", json=sample_product_data
+            )
+            second = await async_client.post(
+                "/api/v1/products", json=sample_product_data
+            )
+
+            first_id = uuid.UUID(first.json()["id"])
+            second_id = uuid.UUID(second.json()["id"])
+
+            assert first_id.version == 4
+            assert first_id.variant == uuid.RFC_4122
+            assert first_id != second_id
+
     async def test_create_product_invalid_data_returns_422(
         self, async_client: AsyncClient
     ) -> None:
@@ -104,10 +129,10 @@ class TestProductsEndpoint:
         self, async_client: AsyncClient, mock_indexed_product: Product
     ) -> None:
         """Test that getting a product returns 200."""
-        with patch("src.api.routes.products.get_indexing_service") as mock_service:
-            mock_instance = AsyncMock()
+        with patch(
+            "src.api.routes.products.indexing_service", new_callable=AsyncMock
+        ) as mock_instance:
             mock_instance.get_product = AsyncMock(return_value=mock_indexed_product)
-            mock_service.return_value = mock_instance
 
             response = await async_client.get("/api/v1/products/1")
 
@@ -117,10 +142,10 @@ class TestProductsEndpoint:
         self, async_client: AsyncClient, mock_indexed_product: Product
     ) -> None:
         """Test that get product returns correct format."""
-        with patch("src.api.routes.products.get_indexing_service") as mock_service:
-            mock_instance = AsyncMock()
+        with patch(
+            "src.api.routes.products.indexing_service", new_callable=AsyncMock
+        ) as mock_instance:
             mock_instance.get_product = AsyncMock(return_value=mock_indexed_product)
-            mock_service.return_value = mock_instance
 
             response = await async_client.get("/api/v1/products/1")
             data = response.json()
@@ -133,26 +158,38 @@ class TestProductsEndpoint:
         self, async_client: AsyncClient
     ) -> None:
         """Test that getting nonexistent product returns 404."""
-        with patch("src.api.routes.products.get_indexing_service") as mock_service:
-            mock_instance = AsyncMock()
+        with patch(
+            "src.api.routes.products.indexing_service", new_callable=AsyncMock
+        ) as mock_instance:
             mock_instance.get_product = AsyncMock(return_value=None)
-            mock_service.return_value = mock_instance
 
             response = await async_client.get("/api/v1/products/999")
 
             assert response.status_code == 404
 
+    async def test_get_product_malformed_id_returns_422(
+        self, async_client: AsyncClient
+    ) -> None:
+        """Test that malformed product IDs are rejected before Elasticsearch."""
+        with patch(
+            "src.api.routes.products.indexing_service", new_callable=AsyncMock
+        ) as mock_instance:
+            response = await async_client.get("/api/v1/products/1' OR '1'='1")
+
+            assert response.status_code == 422
+            mock_instance.get_product.assert_not_called()
+
     async def test_update_product_returns_200(
         self, async_client: AsyncClient, sample_product_data: dict
     ) -> None:
         """Test that updating a product returns 200."""
-        with patch("src.api.routes.products.get_indexing_service") as mock_service:
-            mock_instance = AsyncMock()
+        with patch(
+            "src.api.routes.products.indexing_service", new_callable=AsyncMock
+        ) as mock_instance:
             mock_instance.index_product = AsyncMock(
                 return_value={"result": "updated", "_id": "1"}
             )
             mock_instance.index_name = "test_products"
-            mock_service.return_value = mock_instance
 
             response = await async_client.put(
                 "/api/v1/products/1", json=sample_product_data
@@ -162,10 +199,10 @@ class TestProductsEndpoint:
 
     async def test_delete_product_returns_204(self, async_client: AsyncClient) -> None:
         """Test that deleting a product returns 204."""
-        with patch("src.api.routes.products.get_indexing_service") as mock_service:
-            mock_instance = AsyncMock()
+        with patch(
+            "src.api.routes.products.indexing_service", new_callable=AsyncMock
+        ) as mock_instance:
             mock_instance.delete_product = AsyncMock(return_value={"result": "deleted"})
-            mock_service.return_value = mock_instance
 
             response = await async_client.delete("/api/v1/products/1")
 
@@ -175,10 +212,10 @@ class TestProductsEndpoint:
         self, async_client: AsyncClient
     ) -> None:
         """Test that deleting nonexistent product returns 404."""
-        with patch("src.api.routes.products.get_indexing_service") as mock_service:
-            mock_instance = AsyncMock()
+        with patch(
+            "src.api.routes.products.indexing_service", new_callable=AsyncMock
+        ) as mock_instance:
             mock_instance.delete_product = AsyncMock(return_value=None)
-            mock_service.return_value = mock_instance
 
             response = await async_client.delete("/api/v1/products/999")
 
@@ -211,14 +248,14 @@ class TestBulkEndpoints:
         self, async_client: AsyncClient, sample_products_data: list[dict]
     ) -> None:
         """Test that bulk index returns 200."""
-        with patch("src.api.routes.products.get_indexing_service") as mock_service:
-            mock_instance = AsyncMock()
+        with patch(
+            "src.api.routes.products.indexing_service", new_callable=AsyncMock
+        ) as mock_instance:
             mock_instance.bulk_index_products = AsyncMock(
                 return_value=BulkOperationResult(
                     success_count=2, error_count=0, errors=[]
                 )
             )
-            mock_service.return_value = mock_instance
 
             response = await async_client.post(
                 "/api/v1/products/bulk", json=sample_products_data
@@ -230,14 +267,14 @@ class TestBulkEndpoints:
         self, async_client: AsyncClient, sample_products_data: list[dict]
     ) -> None:
         """Test that bulk index returns correct format."""
-        with patch("src.api.routes.products.get_indexing_service") as mock_service:
-            mock_instance = AsyncMock()
+        with patch(
+            "src.api.routes.products.indexing_service", new_callable=AsyncMock
+        ) as mock_instance:
             mock_instance.bulk_index_products = AsyncMock(
                 return_value=BulkOperationResult(
                     success_count=2, error_count=0, errors=[]
                 )
             )
-            mock_service.return_value = mock_instance
 
             response = await async_client.post(
                 "/api/v1/products/bulk", json=sample_products_data
@@ -253,8 +290,9 @@ class TestBulkEndpoints:
         self, async_client: AsyncClient, sample_products_data: list[dict]
     ) -> None:
         """Test bulk index response with some errors."""
-        with patch("src.api.routes.products.get_indexing_service") as mock_service:
-            mock_instance = AsyncMock()
+        with patch(
+            "src.api.routes.products.indexing_service", new_callable=AsyncMock
+        ) as mock_instance:
             mock_instance.bulk_index_products = AsyncMock(
                 return_value=BulkOperationResult(
                     success_count=1,
@@ -262,7 +300,6 @@ class TestBulkEndpoints:
                     errors=[{"id": "2", "error": "mapping error"}],
                 )
             )
-            mock_service.return_value = mock_instance
 
             response = await async_client.post(
                 "/api/v1/products/bulk", json=sample_products_data
@@ -277,29 +314,77 @@ class TestBulkEndpoints:
         self, async_client: AsyncClient
     ) -> None:
         """Test bulk index with empty list."""
-        with patch("src.api.routes.products.get_indexing_service") as mock_service:
-            mock_instance = AsyncMock()
+        with patch(
+            "src.api.routes.products.indexing_service", new_callable=AsyncMock
+        ) as mock_instance:
             mock_instance.bulk_index_products = AsyncMock(
                 return_value=BulkOperationResult(
                     success_count=0, error_count=0, errors=[]
                 )
             )
-            mock_service.return_value = mock_instance
 
             response = await async_client.post("/api/v1/products/bulk", json=[])
 
             assert response.status_code == 200
 
+    async def test_bulk_index_malformed_id_returns_422(
+        self, async_client: AsyncClient, sample_products_data: list[dict]
+    ) -> None:
+        """Test that bulk bodies use the same ID constraint as the path."""
+        sample_products_data[1]["id"] = "a/b c"
+        with patch(
+            "src.api.routes.products.indexing_service", new_callable=AsyncMock
+        ) as mock_instance:
+            response = await async_client.post(
+                "/api/v1/products/bulk", json=sample_products_data
+            )
+
+            assert response.status_code == 422
+            mock_instance.bulk_index_products.assert_not_called()
+
+    async def test_bulk_indexed_id_round_trips_through_get(
+        self, async_client: AsyncClient, sample_products_data: list[dict]
+    ) -> None:
+        """Test that every ID accepted by bulk index can be fetched by path."""
+        sample_products_data[0]["id"] = "seed_" + "x" * 59
+        stored: dict[str, Product] = {}
+
+        async def bulk_index(products: list[Product]) -> BulkOperationResult:
+            stored.update({product.id: product for product in products})
+            return BulkOperationResult(
+                success_count=len(products), error_count=0, errors=[]
+            )
+
+        async def get_product(product_id: str) -> Product | None:
+            return stored.get(product_id)
+
+        with patch(
+            "src.api.routes.products.indexing_service", new_callable=AsyncMock
+        ) as mock_instance:
+            mock_instance.bulk_index_products = AsyncMock(side_effect=bulk_index)
+            mock_instance.get_product = AsyncMock(side_effect=get_product)
+
+            response = await async_client.post(
+                "/api/v1/products/bulk", json=sample_products_data
+            )
+            assert response.status_code == 200
+
+            for product in sample_products_data:
+                response = await async_client.get(f"/api/v1/products/{product['id']}")
+
+                assert response.status_code == 200
+                assert response.json()["id"] == product["id"]
+
     async def test_bulk_delete_returns_200(self, async_client: AsyncClient) -> None:
         """Test that bulk delete returns 200."""
-        with patch("src.api.routes.products.get_indexing_service") as mock_service:
-            mock_instance = AsyncMock()
+        with patch(
+            "src.api.routes.products.indexing_service", new_callable=AsyncMock
+        ) as mock_instance:
             mock_instance.bulk_delete_products = AsyncMock(
                 return_value=BulkOperationResult(
                     success_count=2, error_count=0, errors=[]
                 )
             )
-            mock_service.return_value = mock_instance
 
             response = await async_client.post(
                 "/api/v1/products/bulk/delete", json=["1", "2"]
@@ -309,14 +394,14 @@ class TestBulkEndpoints:
 
     async def test_bulk_delete_response_format(self, async_client: AsyncClient) -> None:
         """Test that bulk delete returns correct format."""
-        with patch("src.api.routes.products.get_indexing_service") as mock_service:
-            mock_instance = AsyncMock()
+        with patch(
+            "src.api.routes.products.indexing_service", new_callable=AsyncMock
+        ) as mock_instance:
             mock_instance.bulk_delete_products = AsyncMock(
                 return_value=BulkOperationResult(
                     success_count=2, error_count=0, errors=[]
                 )
             )
-            mock_service.return_value = mock_instance
 
             response = await async_client.post(
                 "/api/v1/products/bulk/delete", json=["1", "2"]
@@ -325,3 +410,18 @@ class TestBulkEndpoints:
 
             assert data["success_count"] == 2
             assert data["error_count"] == 0
+
+    @pytest.mark.parametrize("bad_id", ["", "a/b c", "x" * 65])
+    async def test_bulk_delete_malformed_id_returns_422(
+        self, async_client: AsyncClient, bad_id: str
+    ) -> None:
+        """Test that bulk delete rejects IDs the single-ID routes reject."""
+        with patch(
+            "src.api.routes.products.indexing_service", new_callable=AsyncMock
+        ) as mock_instance:
+            response = await async_client.post(
+                "/api/v1/products/bulk/delete", json=["1", bad_id]
+            )
+
+            assert response.status_code == 422
+            mock_instance.bulk_delete_products.assert_not_called()
@@ -0,0 +1,26 @@
+"""Integration tests for application route registration."""
+
+from collections import Counter
+
+import pytest
+from fastapi.routing import APIRoute
+
+from src.main import app
+
+
+@pytest.mark.integration
+class TestRouteRegistration:
+    """Test suite for the mounted route table."""
+
+    def test_each_method_and_path_has_one_handler(self) -> None:
+        """Test that no (method, path) pair is registered twice."""
+        registered = Counter(
+            (method, route.path)
+            for route in app.routes
+            if isinstance(route, APIRoute)
+            for method in route.methods
+        )
+
+        duplicates = [key for key, count in registered.items() if count > 1]
+
+        assert duplicates == []
@@ -20,9 +20,6 @@ class TestSearchEndpoint:
             total=2,
             page=1,
             size=10,
-            total_pages=1,
-            has_next=False,
-            has_previous=False,
             results=[
                 SearchResult(
                     id="1",
@@ -47,10 +44,10 @@ class TestSearchEndpoint:
         self, async_client: AsyncClient, mock_search_response: SearchResponse
     ) -> None:
         """Test that search endpoint returns 200 OK."""
-        with patch("src.api.routes.search.get_search_service") as mock_service:
-            mock_instance = AsyncMock()
+        with patch(
+            "src.api.routes.search.search_service", new_callable=AsyncMock
+        ) as mock_instance:
             mock_instance.search = AsyncMock(return_value=mock_search_response)
-            mock_service.return_value = mock_instance
 
             response = await async_client.get("/api/v1/search", params={"q": "iphone"})
 
@@ -60,10 +57,10 @@ class TestSearchEndpoint:
         self, async_client: AsyncClient, mock_search_response: SearchResponse
     ) -> None:
         """Test that search endpoint returns correct format."""
-        with patch("src.api.routes.search.get_search_service") as mock_service:
-            mock_instance = AsyncMock()
+        with patch(
+            "src.api.routes.search.search_service", new_callable=AsyncMock
+        ) as mock_instance:
             mock_instance.search = AsyncMock(return_value=mock_search_response)
-            mock_service.return_value = mock_instance
 
             response = await async_client.get("/api/v1/search", params={"q": "iphone"})
             data = response.json()
@@ -78,10 +75,10 @@ class TestSearchEndpoint:
         self, async_client: AsyncClient, mock_search_response: SearchResponse
     ) -> None:
         """Test that search endpoint returns results."""
-        with patch("src.api.routes.search.get_search_service") as mock_service:
-            mock_instance = AsyncMock()
+        with patch(
+            "src.api.routes.search.search_service", new_callable=AsyncMock
+        ) as mock_instance:
             mock_instance.search = AsyncMock(return_value=mock_search_response)
-            mock_service.return_value = mock_instance
 
             response = await async_client.get("/api/v1/search", params={"q": "iphone"})
             data = response.json()
@@ -94,10 +91,10 @@ class TestSearchEndpoint:
         self, async_client: AsyncClient, mock_search_response: SearchResponse
     ) -> None:
         """Test that search results include relevance scores."""
-        with patch("src.api.routes.search.get_search_service") as mock_service:
-            mock_instance = AsyncMock()
+        with patch(
+            "src.api.routes.search.search_service", new_callable=AsyncMock
+        ) as mock_instance:
             mock_instance.search = AsyncMock(return_value=mock_search_response)
-            mock_service.return_value = mock_instance
 
             response = await async_client.get("/api/v1/search", params={"q": "iphone"})
             data = response.json()
@@ -109,10 +106,10 @@ class TestSearchEndpoint:
         self, async_client: AsyncClient, mock_search_response: SearchResponse
     ) -> None:
         """Test that search results include highlights."""
-        with patch("src.api.routes.search.get_search_service") as mock_service:
-            mock_instance = AsyncMock()
+        with patch(
+            "src.api.routes.search.search_service", new_callable=AsyncMock
+        ) as mock_instance:
             mock_instance.search = AsyncMock(return_value=mock_search_response)
-            mock_service.return_value = mock_instance
 
             response = await async_client.get("/api/v1/search", params={"q": "iphone"})
             data = response.json()
@@ -140,10 +137,10 @@ class TestSearchEndpoint:
         self, async_client: AsyncClient, mock_search_response: SearchResponse
     ) -> None:
         """Test search with pagination parameters."""
-        with patch("src.api.routes.search.get_search_service") as mock_service:
-            mock_instance = AsyncMock()
+        with patch(
+            "src.api.routes.search.search_service", new_callable=AsyncMock
+        ) as mock_instance:
             mock_instance.search = AsyncMock(return_value=mock_search_response)
-            mock_service.return_value = mock_instance
 
             response = await async_client.get(
                 "/api/v1/search", params={"q": "phone", "page": 2, "size": 20}
@@ -157,10 +154,10 @@ class TestSearchEndpoint:
         self, async_client: AsyncClient, mock_search_response: SearchResponse
     ) -> None:
         """Test search with fuzzy matching disabled."""
-        with patch("src.api.routes.search.get_search_service") as mock_service:
-            mock_instance = AsyncMock()
+        with patch(
+            "src.api.routes.search.search_service", new_callable=AsyncMock
+        ) as mock_instance:
             mock_instance.search = AsyncMock(return_value=mock_search_response)
-            mock_service.return_value = mock_instance
 
             response = await async_client.get(
                 "/api/v1/search", params={"q": "iphone", "fuzzy": "false"}
@@ -172,10 +169,10 @@ class TestSearchEndpoint:
         self, async_client: AsyncClient, mock_search_response: SearchResponse
     ) -> None:
         """Test search with price range filters."""
-        with patch("src.api.routes.search.get_search_service") as mock_service:
-            mock_instance = AsyncMock()
+        with patch(
+            "src.api.routes.search.search_service", new_callable=AsyncMock
+        ) as mock_instance:
             mock_instance.search = AsyncMock(return_value=mock_search_response)
-            mock_service.return_value = mock_instance
 
             response = await async_client.get(
                 "/api/v1/search",
@@ -188,10 +185,10 @@ class TestSearchEndpoint:
         self, async_client: AsyncClient, mock_search_response: SearchResponse
     ) -> None:
         """Test search with category filter."""
-        with patch("src.api.routes.search.get_search_service") as mock_service:
-            mock_instance = AsyncMock()
+        with patch(
+            "src.api.routes.search.search_service", new_callable=AsyncMock
+        ) as mock_instance:
             mock_instance.search = AsyncMock(return_value=mock_search_response)
-            mock_service.return_value = mock_instance
 
             response = await async_client.get(
                 "/api/v1/search", params={"q": "phone", "category": "Electronics"}
@@ -223,13 +220,35 @@ class TestSearchEndpoint:
         self, async_client: AsyncClient, mock_search_response: SearchResponse
     ) -> None:
         """Test that search response includes query time."""
-        with patch("src.api.routes.search.get_search_service") as mock_service:
-            mock_instance = AsyncMock()
+        with patch(
+            "src.api.routes.search.search_service", new_callable=AsyncMock
+        ) as mock_instance:
             mock_instance.search = AsyncMock(return_value=mock_search_response)
-            mock_service.return_value = mock_instance
 
             response = await async_client.get("/api/v1/search", params={"q": "iphone"})
             data = response.json()
 
             assert "took_ms" in data
             assert data["took_ms"] == 10
+
+    async def test_search_response_is_gzipped_when_accepted(
+        self, async_client: AsyncClient, mock_search_response: SearchResponse
+    ) -> None:
+        """Test that large result pages are gzip-encoded for gzip clients."""
+        large_response = mock_search_response.model_copy(
+            update={"results": mock_search_response.results * 10}
+        )
+        with patch(
+            "src.api.routes.search.search_service", new_callable=AsyncMock
+        ) as mock_instance:
+            mock_instance.search = AsyncMock(return_value=large_response)
+
+            response = await async_client.get(
+                "/api/v1/search",
+                params={"q": "iphone"},
+                headers={"Accept-Encoding": "gzip"},
+            )
+
+            assert response.status_code == 200
+            assert response.headers["content-encoding"] == "gzip"
+            assert len(response.json()["results"]) == 20
@@ -118,6 +118,7 @@ class TestConnectionWithRetry:
         with (
             patch("src.elastic.client.AsyncElasticsearch") as mock_es,
             patch("asyncio.sleep") as mock_sleep,
+            patch("src.elastic.client.random.random", return_value=0.5),
         ):
             mock_instance = MagicMock()
             mock_instance.ping = AsyncMock(side_effect=[False, False, True])
@@ -131,6 +132,57 @@ class TestConnectionWithRetry:
             assert sleep_calls[0] == 1.0
             assert sleep_calls[1] == 2.0
 
+    @pytest.mark.asyncio
+    async def test_connect_with_retry_jitters_and_caps_backoff(
+        self, mock_settings: Settings
+    ) -> None:
+        """Test that delays are jittered and never exceed the cap."""
+        from src.elastic.client import MAX_RETRY_DELAY_SECONDS, ElasticsearchClient
+
+        client = ElasticsearchClient(mock_settings)
+
+        with (
+            patch("src.elastic.client.AsyncElasticsearch") as mock_es,
+            patch("asyncio.sleep") as mock_sleep,
+            patch("src.elastic.client.random.random", return_value=0.0),
+        ):
+            mock_instance = MagicMock()
+            mock_instance.ping = AsyncMock(return_value=False)
+            mock_instance.close = AsyncMock()
+            mock_es.return_value = mock_instance
+
+            await client.connect_with_retry(max_retries=4, delay=20.0)
+
+            # Lowest jitter (50%) of 20s, then of the 30s cap twice
+            sleep_calls = [call.args[0] for call in mock_sleep.call_args_list]
+            capped = MAX_RETRY_DELAY_SECONDS / 2
+            assert sleep_calls == [10.0, capped, capped]
+
+    @pytest.mark.asyncio
+    async def test_connect_with_retry_caps_jittered_delay(
+        self, mock_settings: Settings
+    ) -> None:
+        """Test that the highest jitter never sleeps past the cap."""
+        from src.elastic.client import MAX_RETRY_DELAY_SECONDS, ElasticsearchClient
+
+        client = ElasticsearchClient(mock_settings)
+
+        with (
+            patch("src.elastic.client.AsyncElasticsearch") as mock_es,
+            patch("asyncio.sleep") as mock_sleep,
+            patch("src.elastic.client.random.random", return_value=0.999),
+        ):
+            mock_instance = MagicMock()
+            mock_instance.ping = AsyncMock(return_value=False)
+            mock_instance.close = AsyncMock()
+            mock_es.return_value = mock_instance
+
+            await client.connect_with_retry(max_retries=6, delay=5.0)
+
+            sleep_calls = [call.args[0] for call in mock_sleep.call_args_list]
+            assert len(sleep_calls) == 5
+            assert all(delay <= MAX_RETRY_DELAY_SECONDS for delay in sleep_calls)
+
     @pytest.mark.asyncio
     async def test_connect_with_retry_default_parameters(
         self, mock_settings: Settings
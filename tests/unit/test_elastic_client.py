@@ -1,10 +1,15 @@
 """Unit tests for Elasticsearch client wrapper."""
 
-from unittest.mock import AsyncMock, MagicMock, patch
+import asyncio
+from collections.abc import Callable
+from typing import Any
+from unittest.mock import ANY, AsyncMock, MagicMock, patch
 
 import pytest
+from elastic_transport import ObjectApiResponse
 from elasticsearch import AsyncElasticsearch
 from elasticsearch import ConnectionError as ESConnectionError
+from elasticsearch.serializer import OrjsonSerializer
 
 from src.config.settings import Settings
 
@@ -22,10 +27,14 @@ class TestElasticsearchClient:
         )
 
     @pytest.fixture
-    def mock_es_client(self) -> MagicMock:
+    def mock_es_client(
+        self, es_response: Callable[[dict[str, Any]], ObjectApiResponse[Any]]
+    ) -> MagicMock:
         """Provide mock Elasticsearch client."""
         mock = MagicMock(spec=AsyncElasticsearch)
-        mock.info = AsyncMock(return_value={"version": {"number": "8.12.0"}})
+        mock.info = AsyncMock(
+            return_value=es_response({"version": {"number": "8.12.0"}})
+        )
         mock.ping = AsyncMock(return_value=True)
         mock.close = AsyncMock()
         return mock
@@ -55,7 +64,11 @@ class TestElasticsearchClient:
             mock_es.assert_called_once_with(
                 hosts=[mock_settings.elasticsearch_url],
                 request_timeout=mock_settings.elasticsearch_timeout,
+                connections_per_node=mock_settings.elasticsearch_connections_per_node,
+                http_compress=mock_settings.elasticsearch_http_compress,
+                serializer=ANY,
             )
+            assert isinstance(mock_es.call_args.kwargs["serializer"], OrjsonSerializer)
             assert result == mock_instance
 
     @pytest.mark.asyncio
@@ -129,7 +142,10 @@ class TestElasticsearchClient:
 
     @pytest.mark.asyncio
     async def test_get_cluster_info(
-        self, mock_settings: Settings, mock_es_client: MagicMock
+        self,
+        es_response: Callable[[dict[str, Any]], ObjectApiResponse[Any]],
+        mock_settings: Settings,
+        mock_es_client: MagicMock,
     ) -> None:
         """Test getting cluster info."""
         from src.elastic.client import ElasticsearchClient
@@ -139,7 +155,7 @@ class TestElasticsearchClient:
             "cluster_name": "test-cluster",
             "version": {"number": "8.12.0"},
         }
-        mock_es_client.info = AsyncMock(return_value=expected_info)
+        mock_es_client.info = AsyncMock(return_value=es_response(expected_info))
 
         client = ElasticsearchClient(mock_settings)
         client._client = mock_es_client
@@ -176,14 +192,17 @@ class TestElasticsearchClient:
 
     @pytest.mark.asyncio
     async def test_health_check_returns_status(
-        self, mock_settings: Settings, mock_es_client: MagicMock
+        self,
+        es_response: Callable[[dict[str, Any]], ObjectApiResponse[Any]],
+        mock_settings: Settings,
+        mock_es_client: MagicMock,
     ) -> None:
         """Test health check returns cluster health status."""
         from src.elastic.client import ElasticsearchClient
 
         mock_es_client.cluster = MagicMock()
         mock_es_client.cluster.health = AsyncMock(
-            return_value={"status": "green", "number_of_nodes": 1}
+            return_value=es_response({"status": "green", "number_of_nodes": 1})
         )
 
         client = ElasticsearchClient(mock_settings)
@@ -214,6 +233,85 @@ class TestElasticsearchClient:
         assert result["status"] == "unavailable"
         assert "error" in result
 
+    @pytest.mark.asyncio
+    async def test_health_check_reuses_recent_result(
+        self,
+        es_response: Callable[[dict[str, Any]], ObjectApiResponse[Any]],
+        mock_settings: Settings,
+        mock_es_client: MagicMock,
+    ) -> None:
+        """Test that health checks within the cache window hit ES once."""
+        from src.elastic.client import ElasticsearchClient
+
+        mock_es_client.cluster = MagicMock()
+        mock_es_client.cluster.health = AsyncMock(
+            return_value=es_response({"status": "green", "number_of_nodes": 1})
+        )
+
+        client = ElasticsearchClient(mock_settings)
+        client._client = mock_es_client
+
+        with patch("src.elastic.client.time.monotonic", side_effect=[10.0, 10.5, 12.0]):
+            await client.health_check()
+            await client.health_check()
+            await client.health_check()
+
+        assert mock_es_client.cluster.health.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_health_check_does_not_cache_failures(
+        self,
+        es_response: Callable[[dict[str, Any]], ObjectApiResponse[Any]],
+        mock_settings: Settings,
+        mock_es_client: MagicMock,
+    ) -> None:
+        """Test that an unavailable cluster is re-checked on the next probe."""
+        from src.elastic.client import ElasticsearchClient
+
+        mock_es_client.cluster = MagicMock()
+        mock_es_client.cluster.health = AsyncMock(
+            side_effect=[
+                ESConnectionError("Connection failed"),
+                es_response({"status": "green", "number_of_nodes": 1}),
+            ]
+        )
+
+        client = ElasticsearchClient(mock_settings)
+        client._client = mock_es_client
+
+        with patch("src.elastic.client.time.monotonic", return_value=10.0):
+            first = await client.health_check()
+            second = await client.health_check()
+
+        assert first["status"] == "unavailable"
+        assert second["status"] == "green"
+
+    @pytest.mark.asyncio
+    async def test_concurrent_health_checks_share_one_request(
+        self,
+        es_response: Callable[[dict[str, Any]], ObjectApiResponse[Any]],
+        mock_settings: Settings,
+        mock_es_client: MagicMock,
+    ) -> None:
+        """Test that probes arriving together on a miss hit ES once."""
+        from src.elastic.client import ElasticsearchClient
+
+        async def slow_health() -> ObjectApiResponse[Any]:
+            await asyncio.sleep(0)
+            return es_response({"status": "green", "number_of_nodes": 1})
+
+        mock_es_client.cluster = MagicMock()
+        mock_es_client.cluster.health = AsyncMock(side_effect=slow_health)
+
+        client = ElasticsearchClient(mock_settings)
+        client._client = mock_es_client
+
+        with patch("src.elastic.client.time.monotonic", return_value=10.0):
+            results = await asyncio.gather(*(client.health_check() for _ in range(3)))
+
+        assert [r["status"] for r in results] == ["green"] * 3
+        assert mock_es_client.cluster.health.await_count == 1
+
 
 class TestGetElasticsearchClient:
     """Tests for get_elasticsearch_client factory function."""
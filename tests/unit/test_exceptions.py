@@ -0,0 +1,81 @@
+"""Unit tests for API exceptions and the global exception handler."""
+
+import json
+
+from starlette.requests import Request
+
+from src.core.exceptions import (
+    FindoraException,
+    NotFoundError,
+    global_exception_handler,
+)
+from src.core.logging import bind_request_context, clear_request_context
+
+
+def make_request(path: str = "/api/v1/products/1") -> Request:
+    """Build a minimal HTTP request for handler tests."""
+    return Request({"type": "http", "method": "GET", "path": path, "headers": []})
+
+
+class TestFindoraException:
+    """Tests for FindoraException serialization."""
+
+    def test_to_dict_uses_class_defaults(self) -> None:
+        """Test that an exception without arguments uses class defaults."""
+        assert NotFoundError().to_dict() == {
+            "error": {
+                "code": "NOT_FOUND",
+                "message": "The requested resource was not found",
+            }
+        }
+
+    def test_to_dict_includes_details(self) -> None:
+        """Test that details are included when present."""
+        error = NotFoundError("Product not found", details={"product_id": "1"})
+
+        assert error.to_dict()["error"]["details"] == {"product_id": "1"}
+
+    def test_to_dict_includes_request_id(self) -> None:
+        """Test that a passed request ID is included in the body."""
+        body = NotFoundError().to_dict(request_id="abc12345")
+
+        assert body["error"]["request_id"] == "abc12345"
+
+
+class TestGlobalExceptionHandler:
+    """Tests for global_exception_handler."""
+
+    async def test_findora_exception_response(self) -> None:
+        """Test that API errors keep their status code and JSON body."""
+        response = await global_exception_handler(make_request(), NotFoundError())
+
+        assert response.status_code == 404
+        assert response.media_type == "application/json"
+        assert json.loads(response.body) == NotFoundError().to_dict()
+
+    async def test_unexpected_exception_returns_generic_500(self) -> None:
+        """Test that unknown errors are reported as a generic 500."""
+        token = bind_request_context(request_id="abc12345")
+        try:
+            response = await global_exception_handler(
+                make_request(), RuntimeError("boom")
+            )
+        finally:
+            clear_request_context(token)
+
+        body = json.loads(response.body)
+        assert response.status_code == 500
+        assert body["error"]["code"] == FindoraException.error_code
+        assert body["error"]["request_id"] == "abc12345"
+
+    async def test_unexpected_exception_body_is_not_shared(self) -> None:
+        """Test that a request ID from one error doesn't leak into the next."""
+        token = bind_request_context(request_id="abc12345")
+        try:
+            await global_exception_handler(make_request(), RuntimeError("boom"))
+        finally:
+            clear_request_context(token)
+
+        response = await global_exception_handler(make_request(), RuntimeError("boom"))
+
+        assert "request_id" not in json.loads(response.body)["error"]
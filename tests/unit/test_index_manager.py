@@ -1,14 +1,26 @@
 """Unit tests for Elasticsearch index management."""
 
+from collections.abc import Callable
+from typing import Any
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
-from elasticsearch import AsyncElasticsearch
+from elastic_transport import ObjectApiResponse
+from elasticsearch import AsyncElasticsearch, BadRequestError
 from elasticsearch import NotFoundError as ESNotFoundError
 
 from src.config.settings import Settings
 
 
+def bad_request(error_type: str) -> BadRequestError:
+    """Build a 400 error as raised by the Elasticsearch client."""
+    return BadRequestError(
+        message=error_type,
+        meta=MagicMock(),
+        body={"error": {"type": error_type}},
+    )
+
+
 class TestIndexManager:
     """Tests for IndexManager service."""
 
@@ -22,15 +34,23 @@ class TestIndexManager:
         )
 
     @pytest.fixture
-    def mock_es_client(self) -> MagicMock:
+    def mock_es_client(
+        self, es_response: Callable[[dict[str, Any]], ObjectApiResponse[Any]]
+    ) -> MagicMock:
         """Provide mock Elasticsearch client."""
         mock = MagicMock(spec=AsyncElasticsearch)
         mock.indices = MagicMock()
         mock.indices.exists = AsyncMock(return_value=True)
-        mock.indices.create = AsyncMock(return_value={"acknowledged": True})
-        mock.indices.delete = AsyncMock(return_value={"acknowledged": True})
-        mock.indices.get_mapping = AsyncMock(return_value={})
-        mock.indices.put_mapping = AsyncMock(return_value={"acknowledged": True})
+        mock.indices.create = AsyncMock(
+            return_value=es_response({"acknowledged": True})
+        )
+        mock.indices.delete = AsyncMock(
+            return_value=es_response({"acknowledged": True})
+        )
+        mock.indices.get_mapping = AsyncMock(return_value=es_response({}))
+        mock.indices.put_mapping = AsyncMock(
+            return_value=es_response({"acknowledged": True})
+        )
         mock.indices.refresh = AsyncMock()
         return mock
 
@@ -90,15 +110,17 @@ class TestIndexManager:
 
     @pytest.mark.asyncio
     async def test_create_index_success(
-        self, mock_elastic_client: MagicMock, mock_settings: Settings
+        self,
+        es_response: Callable[[dict[str, Any]], ObjectApiResponse[Any]],
+        mock_elastic_client: MagicMock,
+        mock_settings: Settings,
     ) -> None:
         """Test successful index creation."""
         from src.elastic.index_manager import IndexManager
 
         manager = IndexManager(mock_elastic_client, mock_settings)
-        mock_elastic_client._client.indices.exists = AsyncMock(return_value=False)
         mock_elastic_client._client.indices.create = AsyncMock(
-            return_value={"acknowledged": True, "index": "test_products"}
+            return_value=es_response({"acknowledged": True, "index": "test_products"})
         )
 
         result = await manager.create_index()
@@ -114,7 +136,6 @@ class TestIndexManager:
         from src.elastic.index_manager import IndexManager
 
         manager = IndexManager(mock_elastic_client, mock_settings)
-        mock_elastic_client._client.indices.exists = AsyncMock(return_value=False)
 
         mappings = {
             "properties": {
@@ -138,7 +159,6 @@ class TestIndexManager:
         from src.elastic.index_manager import IndexManager
 
         manager = IndexManager(mock_elastic_client, mock_settings)
-        mock_elastic_client._client.indices.exists = AsyncMock(return_value=False)
 
         index_settings = {
             "number_of_shards": 1,
@@ -159,24 +179,43 @@ class TestIndexManager:
         from src.elastic.index_manager import IndexManager
 
         manager = IndexManager(mock_elastic_client, mock_settings)
-        mock_elastic_client._client.indices.exists = AsyncMock(return_value=True)
+        mock_elastic_client._client.indices.create = AsyncMock(
+            side_effect=bad_request("resource_already_exists_exception")
+        )
 
         result = await manager.create_index()
 
         assert result is None
-        mock_elastic_client._client.indices.create.assert_not_called()
+        mock_elastic_client._client.indices.exists.assert_not_called()
 
     @pytest.mark.asyncio
-    async def test_delete_index_success(
+    async def test_create_index_reraises_other_bad_requests(
         self, mock_elastic_client: MagicMock, mock_settings: Settings
+    ) -> None:
+        """Test create_index propagates bad requests other than a conflict."""
+        from src.elastic.index_manager import IndexManager
+
+        manager = IndexManager(mock_elastic_client, mock_settings)
+        mock_elastic_client._client.indices.create = AsyncMock(
+            side_effect=bad_request("mapper_parsing_exception")
+        )
+
+        with pytest.raises(BadRequestError):
+            await manager.create_index()
+
+    @pytest.mark.asyncio
+    async def test_delete_index_success(
+        self,
+        es_response: Callable[[dict[str, Any]], ObjectApiResponse[Any]],
+        mock_elastic_client: MagicMock,
+        mock_settings: Settings,
     ) -> None:
         """Test successful index deletion."""
         from src.elastic.index_manager import IndexManager
 
         manager = IndexManager(mock_elastic_client, mock_settings)
-        mock_elastic_client._client.indices.exists = AsyncMock(return_value=True)
         mock_elastic_client._client.indices.delete = AsyncMock(
-            return_value={"acknowledged": True}
+            return_value=es_response({"acknowledged": True})
         )
 
         result = await manager.delete_index()
@@ -194,16 +233,24 @@ class TestIndexManager:
         from src.elastic.index_manager import IndexManager
 
         manager = IndexManager(mock_elastic_client, mock_settings)
-        mock_elastic_client._client.indices.exists = AsyncMock(return_value=False)
+        mock_elastic_client._client.indices.delete = AsyncMock(
+            side_effect=ESNotFoundError(
+                message="index_not_found",
+                meta=MagicMock(),
+                body={"error": {"type": "index_not_found_exception"}},
+            )
+        )
 
         result = await manager.delete_index()
 
         assert result is None
-        mock_elastic_client._client.indices.delete.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_get_mapping(
-        self, mock_elastic_client: MagicMock, mock_settings: Settings
+        self,
+        es_response: Callable[[dict[str, Any]], ObjectApiResponse[Any]],
+        mock_elastic_client: MagicMock,
+        mock_settings: Settings,
     ) -> None:
         """Test getting index mappings."""
         from src.elastic.index_manager import IndexManager
@@ -219,7 +266,7 @@ class TestIndexManager:
             }
         }
         mock_elastic_client._client.indices.get_mapping = AsyncMock(
-            return_value=expected_mapping
+            return_value=es_response(expected_mapping)
         )
 
         result = await manager.get_mapping()
@@ -266,15 +313,17 @@ class TestIndexManager:
 
     @pytest.mark.asyncio
     async def test_ensure_index_creates_if_not_exists(
-        self, mock_elastic_client: MagicMock, mock_settings: Settings
+        self,
+        es_response: Callable[[dict[str, Any]], ObjectApiResponse[Any]],
+        mock_elastic_client: MagicMock,
+        mock_settings: Settings,
     ) -> None:
         """Test ensure_index creates index if it doesn't exist."""
         from src.elastic.index_manager import IndexManager
 
         manager = IndexManager(mock_elastic_client, mock_settings)
-        mock_elastic_client._client.indices.exists = AsyncMock(return_value=False)
         mock_elastic_client._client.indices.create = AsyncMock(
-            return_value={"acknowledged": True}
+            return_value=es_response({"acknowledged": True})
         )
 
         result = await manager.ensure_index()
@@ -286,16 +335,18 @@ class TestIndexManager:
     async def test_ensure_index_skips_if_exists(
         self, mock_elastic_client: MagicMock, mock_settings: Settings
     ) -> None:
-        """Test ensure_index skips creation if index exists."""
+        """Test ensure_index succeeds if the index already exists."""
         from src.elastic.index_manager import IndexManager
 
         manager = IndexManager(mock_elastic_client, mock_settings)
-        mock_elastic_client._client.indices.exists = AsyncMock(return_value=True)
+        mock_elastic_client._client.indices.create = AsyncMock(
+            side_effect=bad_request("resource_already_exists_exception")
+        )
 
         result = await manager.ensure_index()
 
         assert result is True
-        mock_elastic_client._client.indices.create.assert_not_called()
+        mock_elastic_client._client.indices.exists.assert_not_called()
 
 
 class TestGetIndexManager:
@@ -1,13 +1,36 @@
 """Unit tests for indexing service."""
 
+from collections.abc import AsyncIterator, Callable, Iterable
+from typing import Any
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
+from elastic_transport import ObjectApiResponse
 
 from src.config.settings import Settings
 from src.models.product import Product
 
 
+def streaming_bulk_results(
+    *results: tuple[bool, dict[str, Any]],
+) -> Callable[..., AsyncIterator[tuple[bool, dict[str, Any]]]]:
+    """Build a stand-in for async_streaming_bulk that yields fixed items."""
+
+    async def fake_streaming_bulk(
+        _client: Any, actions: Iterable[dict[str, Any]], **_kwargs: Any
+    ) -> AsyncIterator[tuple[bool, dict[str, Any]]]:
+        list(actions)
+        for result in results:
+            yield result
+
+    return fake_streaming_bulk
+
+
+def ok_items(count: int) -> list[tuple[bool, dict[str, Any]]]:
+    """Build successful bulk item results."""
+    return [(True, {"index": {"_id": str(i), "status": 201}}) for i in range(count)]
+
+
 class TestIndexingService:
     """Tests for IndexingService."""
 
@@ -65,6 +88,7 @@ class TestIndexingService:
     @pytest.mark.asyncio
     async def test_index_single_product(
         self,
+        es_response: Callable[[dict[str, Any]], ObjectApiResponse[Any]],
         mock_elastic_client: MagicMock,
         mock_settings: Settings,
         sample_product: Product,
@@ -73,7 +97,7 @@ class TestIndexingService:
         from src.services.indexing import IndexingService
 
         mock_elastic_client._client.index = AsyncMock(
-            return_value={"result": "created", "_id": "1"}
+            return_value=es_response({"result": "created", "_id": "1"})
         )
 
         service = IndexingService(mock_elastic_client, mock_settings)
@@ -86,6 +110,7 @@ class TestIndexingService:
     @pytest.mark.asyncio
     async def test_index_product_with_id(
         self,
+        es_response: Callable[[dict[str, Any]], ObjectApiResponse[Any]],
         mock_elastic_client: MagicMock,
         mock_settings: Settings,
         sample_product: Product,
@@ -94,7 +119,7 @@ class TestIndexingService:
         from src.services.indexing import IndexingService
 
         mock_elastic_client._client.index = AsyncMock(
-            return_value={"result": "created", "_id": "1"}
+            return_value=es_response({"result": "created", "_id": "1"})
         )
 
         service = IndexingService(mock_elastic_client, mock_settings)
@@ -108,6 +133,7 @@ class TestIndexingService:
     @pytest.mark.asyncio
     async def test_index_product_document_body(
         self,
+        es_response: Callable[[dict[str, Any]], ObjectApiResponse[Any]],
         mock_elastic_client: MagicMock,
         mock_settings: Settings,
         sample_product: Product,
@@ -116,7 +142,7 @@ class TestIndexingService:
         from src.services.indexing import IndexingService
 
         mock_elastic_client._client.index = AsyncMock(
-            return_value={"result": "created", "_id": "1"}
+            return_value=es_response({"result": "created", "_id": "1"})
         )
 
         service = IndexingService(mock_elastic_client, mock_settings)
@@ -133,6 +159,7 @@ class TestIndexingService:
     @pytest.mark.asyncio
     async def test_update_product(
         self,
+        es_response: Callable[[dict[str, Any]], ObjectApiResponse[Any]],
         mock_elastic_client: MagicMock,
         mock_settings: Settings,
         sample_product: Product,
@@ -141,7 +168,7 @@ class TestIndexingService:
         from src.services.indexing import IndexingService
 
         mock_elastic_client._client.index = AsyncMock(
-            return_value={"result": "updated", "_id": "1"}
+            return_value=es_response({"result": "updated", "_id": "1"})
         )
 
         service = IndexingService(mock_elastic_client, mock_settings)
@@ -153,13 +180,16 @@ class TestIndexingService:
 
     @pytest.mark.asyncio
     async def test_delete_product(
-        self, mock_elastic_client: MagicMock, mock_settings: Settings
+        self,
+        es_response: Callable[[dict[str, Any]], ObjectApiResponse[Any]],
+        mock_elastic_client: MagicMock,
+        mock_settings: Settings,
     ) -> None:
         """Test deleting a product."""
         from src.services.indexing import IndexingService
 
         mock_elastic_client._client.delete = AsyncMock(
-            return_value={"result": "deleted", "_id": "1"}
+            return_value=es_response({"result": "deleted", "_id": "1"})
         )
 
         service = IndexingService(mock_elastic_client, mock_settings)
@@ -277,6 +307,70 @@ class TestIndexingService:
 
         assert result is False
 
+    @pytest.mark.asyncio
+    async def test_index_product_invalidates_search_cache(
+        self,
+        es_response: Callable[[dict[str, Any]], ObjectApiResponse[Any]],
+        mock_elastic_client: MagicMock,
+        mock_settings: Settings,
+        sample_product: Product,
+    ) -> None:
+        """Test that indexing a product clears cached search responses."""
+        from src.models.product import SearchResponse
+        from src.services.cache import SearchCache
+        from src.services.indexing import IndexingService
+
+        mock_elastic_client._client.index = AsyncMock(
+            return_value=es_response({"result": "created", "_id": "1"})
+        )
+        cache = SearchCache(max_size=10, ttl_seconds=60)
+        cache.set(
+            ("iphone",),
+            SearchResponse(
+                query="iphone",
+                total=0,
+                page=1,
+                size=10,
+            ),
+        )
+
+        service = IndexingService(mock_elastic_client, mock_settings, cache)
+        await service.index_product(sample_product)
+
+        assert len(cache) == 0
+
+    @pytest.mark.asyncio
+    async def test_index_product_invalidates_cache_after_refresh(
+        self,
+        es_response: Callable[[dict[str, Any]], ObjectApiResponse[Any]],
+        mock_elastic_client: MagicMock,
+        mock_settings: Settings,
+        sample_product: Product,
+    ) -> None:
+        """Test that a search between the write and the refresh isn't kept."""
+        from src.models.product import SearchResponse
+        from src.services.cache import SearchCache
+        from src.services.indexing import IndexingService
+
+        cache = SearchCache(max_size=10, ttl_seconds=60)
+
+        async def index_then_search(**_kwargs: Any) -> ObjectApiResponse[Any]:
+            # A search served before the refresh caches pre-write results
+            cache.set(
+                ("iphone",),
+                SearchResponse(query="iphone", total=0, page=1, size=10),
+            )
+            return es_response({"result": "created", "_id": "1"})
+
+        mock_elastic_client._client.index = AsyncMock(side_effect=index_then_search)
+
+        service = IndexingService(mock_elastic_client, mock_settings, cache)
+        await service.index_product(sample_product)
+
+        kwargs = mock_elastic_client._client.index.call_args.kwargs
+        assert kwargs["refresh"] == "wait_for"
+        assert cache.get(("iphone",)) is None
+
 
 class TestBulkIndexing:
     """Tests for bulk indexing operations."""
@@ -345,9 +439,10 @@ class TestBulkIndexing:
 
         from src.services.indexing import IndexingService
 
-        with patch("src.services.indexing.async_bulk") as mock_bulk:
-            mock_bulk.return_value = (3, [])  # (success_count, errors)
-
+        with patch(
+            "src.services.indexing.async_streaming_bulk",
+            side_effect=streaming_bulk_results(*ok_items(3)),
+        ):
             service = IndexingService(mock_elastic_client, mock_settings)
 
             result = await service.bulk_index_products(sample_products)
@@ -391,9 +486,10 @@ class TestBulkIndexing:
             }
         ]
 
-        with patch("src.services.indexing.async_bulk") as mock_bulk:
-            mock_bulk.return_value = (2, errors)
-
+        with patch(
+            "src.services.indexing.async_streaming_bulk",
+            side_effect=streaming_bulk_results(*ok_items(2), (False, errors[0])),
+        ):
             service = IndexingService(mock_elastic_client, mock_settings)
 
             result = await service.bulk_index_products(sample_products)
@@ -418,11 +514,14 @@ class TestBulkIndexing:
 
         async def capture_bulk(
             client: MagicMock, actions: list, **kwargs: dict
-        ) -> tuple:
+        ) -> AsyncIterator[tuple[bool, dict[str, Any]]]:
             captured_actions.extend(list(actions))
-            return (len(captured_actions), [])
+            for result in ok_items(len(captured_actions)):
+                yield result
 
-        with patch("src.services.indexing.async_bulk", side_effect=capture_bulk):
+        with patch(
+            "src.services.indexing.async_streaming_bulk", side_effect=capture_bulk
+        ):
             service = IndexingService(mock_elastic_client, mock_settings)
 
             await service.bulk_index_products(sample_products)
@@ -432,6 +531,104 @@ class TestBulkIndexing:
             assert captured_actions[0]["_id"] == "1"
             assert captured_actions[0]["_source"]["name"] == "iPhone 15"
 
+    @pytest.mark.asyncio
+    async def test_bulk_index_passes_chunking_settings(
+        self,
+        mock_elastic_client: MagicMock,
+        mock_settings: Settings,
+        sample_products: list[Product],
+    ) -> None:
+        """Test that bulk index forwards chunk and retry settings."""
+        from unittest.mock import patch
+
+        from src.services.indexing import IndexingService
+
+        with patch(
+            "src.services.indexing.async_streaming_bulk",
+            side_effect=streaming_bulk_results(*ok_items(3)),
+        ) as mock_bulk:
+            service = IndexingService(mock_elastic_client, mock_settings)
+
+            await service.bulk_index_products(sample_products)
+
+            kwargs = mock_bulk.call_args.kwargs
+            assert kwargs["chunk_size"] == mock_settings.bulk_chunk_size
+            assert kwargs["max_chunk_bytes"] == mock_settings.bulk_max_chunk_bytes
+            assert kwargs["max_retries"] == mock_settings.bulk_max_retries
+            assert "refresh" not in kwargs
+
+    @pytest.mark.asyncio
+    async def test_bulk_index_refreshes_once_with_cache(
+        self,
+        mock_elastic_client: MagicMock,
+        mock_settings: Settings,
+        sample_products: list[Product],
+    ) -> None:
+        """Test that a cached bulk write refreshes once, then clears the cache."""
+        from unittest.mock import patch
+
+        from src.models.product import SearchResponse
+        from src.services.cache import SearchCache
+        from src.services.indexing import IndexingService
+
+        cache = SearchCache(max_size=10, ttl_seconds=60)
+        cache.set(("iphone",), SearchResponse(query="iphone", total=0, page=1, size=10))
+        cached_at_refresh: list[int] = []
+
+        async def refresh(**_kwargs: Any) -> None:
+            cached_at_refresh.append(len(cache))
+
+        mock_elastic_client._client.indices.refresh = AsyncMock(side_effect=refresh)
+
+        with patch(
+            "src.services.indexing.async_streaming_bulk",
+            side_effect=streaming_bulk_results(*ok_items(3)),
+        ) as mock_bulk:
+            service = IndexingService(mock_elastic_client, mock_settings, cache)
+
+            await service.bulk_index_products(sample_products)
+
+            # Chunks don't wait for refreshes; one refresh runs at the end
+            assert "refresh" not in mock_bulk.call_args.kwargs
+            mock_elastic_client._client.indices.refresh.assert_called_once_with(
+                index=mock_settings.elasticsearch_index
+            )
+            assert cached_at_refresh == [1]
+            assert len(cache) == 0
+
+    @pytest.mark.asyncio
+    async def test_bulk_index_caps_reported_errors(
+        self,
+        mock_elastic_client: MagicMock,
+        sample_products: list[Product],
+    ) -> None:
+        """Test that all failures are counted but only the first few are kept."""
+        from unittest.mock import patch
+
+        from src.services.indexing import IndexingService
+
+        settings = Settings(
+            elasticsearch_url="http://localhost:9200",
+            elasticsearch_index="test_products",
+            bulk_max_reported_errors=2,
+        )
+        failures = [
+            (False, {"index": {"_id": str(i), "error": {"type": "mapper_parsing"}}})
+            for i in range(5)
+        ]
+
+        with patch(
+            "src.services.indexing.async_streaming_bulk",
+            side_effect=streaming_bulk_results(*ok_items(1), *failures),
+        ):
+            service = IndexingService(mock_elastic_client, settings)
+
+            result = await service.bulk_index_products(sample_products)
+
+        assert result.success_count == 1
+        assert result.error_count == 5
+        assert [e["index"]["_id"] for e in result.errors] == ["0", "1"]
+
 
 class TestBulkDeleteProducts:
     """Tests for bulk delete operations."""
@@ -462,9 +659,10 @@ class TestBulkDeleteProducts:
 
         from src.services.indexing import IndexingService
 
-        with patch("src.services.indexing.async_bulk") as mock_bulk:
-            mock_bulk.return_value = (3, [])
-
+        with patch(
+            "src.services.indexing.async_streaming_bulk",
+            side_effect=streaming_bulk_results(*ok_items(3)),
+        ):
             service = IndexingService(mock_elastic_client, mock_settings)
 
             result = await service.bulk_delete_products(["1", "2", "3"])
@@ -498,3 +696,9 @@ class TestGetIndexingService:
 
         assert service is not None
         assert service.index_name is not None
+
+    def test_get_indexing_service_returns_singleton(self) -> None:
+        """Test factory returns the same instance on every call."""
+        from src.services.indexing import get_indexing_service
+
+        assert get_indexing_service() is get_indexing_service()
@@ -0,0 +1,141 @@
+"""Unit tests for logging helpers."""
+
+import logging
+import queue
+import sys
+from unittest.mock import patch
+
+import pytest
+import structlog
+
+from src.core.logging import (
+    BoundedQueueHandler,
+    bind_request_context,
+    clear_request_context,
+    get_logger,
+    get_request_id,
+    merge_request_context,
+    setup_logging,
+    shutdown_logging,
+)
+
+
+def make_record(msg: str) -> logging.LogRecord:
+    """Build a plain INFO log record."""
+    return logging.LogRecord("test", logging.INFO, "", 0, msg, None, None)
+
+
+class TestSetupLogging:
+    """Tests for setup_logging."""
+
+    def test_filters_below_configured_level(self) -> None:
+        """Test that loggers drop calls below the configured level."""
+        setup_logging(log_level="INFO")
+        try:
+            logger = get_logger("test")
+
+            assert not logger.is_enabled_for(logging.DEBUG)
+            assert logger.is_enabled_for(logging.INFO)
+        finally:
+            shutdown_logging()
+            structlog.reset_defaults()
+
+    def test_shutdown_flushes_in_order(
+        self, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        """Test that queued records are written before later direct writes."""
+        handler = BoundedQueueHandler(queue.Queue())
+        with patch("src.core.logging._queue_handler", handler):
+            setup_logging(log_level="INFO")
+            try:
+                for i in range(50):
+                    handler.handle(make_record(f"queued_{i}"))
+                shutdown_logging()
+                handler.handle(make_record("direct"))
+            finally:
+                shutdown_logging()
+                structlog.reset_defaults()
+
+        out = capsys.readouterr().out.split()
+        assert out == [*(f"queued_{i}" for i in range(50)), "direct"]
+
+    def test_registers_exit_flush_once(self) -> None:
+        """Test that the interpreter-exit flush is registered only once."""
+        with (
+            patch("src.core.logging._atexit_registered", False),
+            patch("src.core.logging.atexit.register") as mock_register,
+        ):
+            setup_logging(log_level="INFO")
+            setup_logging(log_level="INFO")
+            shutdown_logging()
+            structlog.reset_defaults()
+
+        mock_register.assert_called_once_with(shutdown_logging)
+
+
+class TestBoundedQueueHandler:
+    """Tests for the non-blocking queue handler."""
+
+    def test_drops_and_counts_when_full(self) -> None:
+        """Test that a full queue drops records instead of blocking."""
+        log_queue: queue.Queue[logging.LogRecord | None] = queue.Queue(maxsize=1)
+        handler = BoundedQueueHandler(log_queue)
+        record = make_record("msg")
+
+        handler.handle(record)
+        handler.handle(record)
+
+        assert log_queue.qsize() == 1
+        assert handler.dropped == 1
+
+    def test_writes_through_fallback_after_shutdown(
+        self, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        """Test that records bypass the queue once a fallback is set."""
+        log_queue: queue.Queue[logging.LogRecord | None] = queue.Queue(maxsize=1)
+        handler = BoundedQueueHandler(log_queue)
+        handler.fallback = logging.StreamHandler(sys.stdout)
+        record = make_record("after_shutdown")
+
+        handler.handle(record)
+
+        assert log_queue.empty()
+        assert "after_shutdown" in capsys.readouterr().out
+
+
+class TestRequestContext:
+    """Tests for per-request log context."""
+
+    def test_merge_adds_bound_context(self) -> None:
+        """Test that bound context is added to log entries."""
+        token = bind_request_context(request_id="abc12345", path="/api/v1/search")
+        try:
+            event = merge_request_context(None, "info", {"event": "search_completed"})
+        finally:
+            clear_request_context(token)
+
+        assert event == {
+            "request_id": "abc12345",
+            "path": "/api/v1/search",
+            "event": "search_completed",
+        }
+
+    def test_explicit_keys_take_precedence(self) -> None:
+        """Test that keys passed to the log call override bound context."""
+        token = bind_request_context(request_id="abc12345", path="/api/v1/search")
+        try:
+            event = merge_request_context(None, "info", {"path": "/other"})
+        finally:
+            clear_request_context(token)
+
+        assert event["path"] == "/other"
+
+    def test_clear_restores_previous_context(self) -> None:
+        """Test that clearing the context drops the request ID."""
+        token = bind_request_context(request_id="abc12345")
+        assert get_request_id() == "abc12345"
+
+        clear_request_context(token)
+
+        assert get_request_id() is None
+        assert merge_request_context(None, "info", {"event": "x"}) == {"event": "x"}
@@ -0,0 +1,58 @@
+"""Unit tests for application startup checks."""
+
+from unittest.mock import patch
+
+import pytest
+
+from src.config.settings import Settings
+from src.main import app, lifespan, warn_per_worker_state
+
+
+class TestWarnPerWorkerState:
+    """Tests for the multi-worker startup warning."""
+
+    def test_warns_about_unshared_rate_limits_and_cache(self) -> None:
+        """Test that in-memory rate limits and the cache are flagged."""
+        settings = Settings(web_concurrency=4, redis_url=None, cache_enabled=True)
+
+        with (
+            patch("src.main.settings", settings),
+            patch("src.main.logger") as mock_logger,
+        ):
+            warn_per_worker_state()
+
+        events = [call.args[0] for call in mock_logger.warning.call_args_list]
+        assert events == ["rate_limits_per_worker", "search_cache_per_worker"]
+
+    def test_no_warning_with_shared_state(self) -> None:
+        """Test that Redis-backed limits without a cache log nothing."""
+        settings = Settings(
+            web_concurrency=4,
+            redis_url="redis://localhost:6379",
+            cache_enabled=False,
+        )
+
+        with (
+            patch("src.main.settings", settings),
+            patch("src.main.logger") as mock_logger,
+        ):
+            warn_per_worker_state()
+
+        mock_logger.warning.assert_not_called()
+
+
+class TestLifespan:
+    """Tests for the application lifespan handler."""
+
+    @pytest.mark.asyncio
+    async def test_flushes_logs_when_app_fails(self) -> None:
+        """Test that logging is shut down even if the app raises."""
+        with (
+            patch("src.main.setup_logging"),
+            patch("src.main.shutdown_logging") as mock_shutdown,
+            pytest.raises(RuntimeError),
+        ):
+            async with lifespan(app):
+                raise RuntimeError("boom")
+
+        mock_shutdown.assert_called_once()
@@ -0,0 +1,76 @@
+"""Unit tests for the request context middleware."""
+
+import re
+from unittest.mock import patch
+
+import pytest
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import PlainTextResponse
+from starlette.routing import Route
+from starlette.testclient import TestClient
+
+from src.core.middleware import RequestContextMiddleware
+
+
+async def echo_request_id(request: Request) -> PlainTextResponse:
+    """Return the request ID seen by the handler."""
+    return PlainTextResponse(getattr(request.state, "request_id", ""))
+
+
+async def fail(_request: Request) -> PlainTextResponse:
+    """Raise an unhandled error."""
+    raise RuntimeError("boom")
+
+
+@pytest.fixture
+def client() -> TestClient:
+    """Provide a client for an app wrapped in the middleware."""
+    app = Starlette(
+        routes=[
+            Route("/echo", echo_request_id),
+            Route("/fail", fail),
+            Route("/health", echo_request_id),
+        ]
+    )
+    app.add_middleware(RequestContextMiddleware)
+    return TestClient(app, raise_server_exceptions=False)
+
+
+class TestRequestContextMiddleware:
+    """Tests for RequestContextMiddleware."""
+
+    def test_adds_request_id_header(self, client: TestClient) -> None:
+        """Test that responses carry the request ID given to the handler."""
+        response = client.get("/echo")
+
+        assert re.fullmatch(r"[0-9a-f]{8}", response.headers["X-Request-ID"])
+        assert response.headers["X-Request-ID"] == response.text
+
+    def test_unhandled_exception_propagates(self, client: TestClient) -> None:
+        """Test that unhandled errors still reach the server error handler."""
+        response = client.get("/fail")
+
+        assert response.status_code == 500
+
+    def test_health_probe_is_not_tracked(self, client: TestClient) -> None:
+        """Test that health probes skip request tracking."""
+        response = client.get("/health")
+
+        assert "X-Request-ID" not in response.headers
+        assert response.text == ""
+
+    def test_logs_duration_in_milliseconds(self, client: TestClient) -> None:
+        """Test that the access log reports duration with 0.01 ms precision."""
+        with (
+            patch(
+                "src.core.middleware.time.perf_counter_ns",
+                side_effect=[1_000_000_000, 1_012_345_678],
+            ),
+            patch("src.core.middleware.logger") as mock_logger,
+        ):
+            client.get("/echo")
+
+        mock_logger.info.assert_called_once_with(
+            "request_completed", status_code=200, duration_ms=12.34
+        )
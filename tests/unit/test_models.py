@@ -152,6 +152,30 @@ class TestSearchQueryModel:
         assert query.sort_by == SortField.PRICE
         assert query.sort_order == SortOrder.ASC
 
+    def test_search_query_dedupes_categories(self) -> None:
+        """Test repeated categories are collapsed in first-seen order."""
+        query = SearchQuery(q="phone", categories=["Phones", "Electronics", "Phones"])
+
+        assert query.categories == ["Phones", "Electronics"]
+
+    def test_search_query_empty_categories_is_none(self) -> None:
+        """Test an empty categories list is treated as no filter."""
+        query = SearchQuery(q="phone", categories=[])
+
+        assert query.categories is None
+
+    def test_search_query_single_category_folds_into_categories(self) -> None:
+        """Test a single category is exposed through categories."""
+        query = SearchQuery(q="phone", category="Electronics")
+
+        assert query.categories == ["Electronics"]
+
+    def test_search_query_categories_take_precedence(self) -> None:
+        """Test categories wins over category when both are given."""
+        query = SearchQuery(q="phone", category="Single", categories=["Phones"])
+
+        assert query.categories == ["Phones"]
+
     def test_search_query_empty_string(self) -> None:
         """Test search query requires non-empty string."""
         with pytest.raises(ValidationError):
@@ -215,6 +239,55 @@ class TestSearchResultModel:
 
         assert result.highlights is None
 
+    def test_search_result_is_frozen(self) -> None:
+        """Test that results can't be mutated (cached responses are shared)."""
+        result = SearchResult(
+            id="1",
+            name="iPhone 15",
+            description="Apple smartphone",
+            price=799.99,
+            score=1.5,
+        )
+
+        with pytest.raises(ValidationError):
+            result.price = 1.0  # type: ignore[misc]
+
+    def test_from_es_hit(self) -> None:
+        """Test building a result from an Elasticsearch hit."""
+        hit = {
+            "_id": "1",
+            "_score": None,
+            "_source": {
+                "name": "iPhone 15",
+                "description": "Apple smartphone",
+                "price": 799.99,
+            },
+            "highlight": {"name": ["<em>iPhone</em> 15"]},
+        }
+
+        result = SearchResult.from_es_hit(hit)
+
+        assert result.id == "1"
+        assert result.price == 799.99
+        assert result.category is None
+        assert result.score == 0.0
+        assert result.highlights == {"name": ["<em>iPhone</em> 15"]}
+        assert result.model_dump()["name"] == "iPhone 15"
+
+    def test_from_es_hit_coerces_integer_numbers(self) -> None:
+        """Test that numbers stored as integers come back as floats."""
+        hit = {
+            "_id": "1",
+            "_score": 2,
+            "_source": {"name": "Cable", "description": "USB-C cable", "price": 5},
+        }
+
+        result = SearchResult.from_es_hit(hit)
+
+        assert isinstance(result.price, float)
+        assert isinstance(result.score, float)
+        assert '"price":5.0' in result.model_dump_json()
+
 
 class TestSearchResponseModel:
     """Tests for SearchResponse model."""
@@ -236,9 +309,6 @@ class TestSearchResponseModel:
             total=1,
             page=1,
             size=10,
-            total_pages=1,
-            has_next=False,
-            has_previous=False,
             results=results,
         )
 
@@ -254,9 +324,6 @@ class TestSearchResponseModel:
             total=0,
             page=1,
             size=10,
-            total_pages=0,
-            has_next=False,
-            has_previous=False,
             results=[],
         )
 
@@ -271,9 +338,6 @@ class TestSearchResponseModel:
             total=50,
             page=3,
             size=10,
-            total_pages=5,
-            has_next=True,
-            has_previous=True,
             results=[],
         )
 
@@ -291,9 +355,6 @@ class TestSearchResponseModel:
             total=50,
             page=1,
             size=10,
-            total_pages=5,
-            has_next=True,
-            has_previous=False,
             results=[],
         )
 
@@ -307,9 +368,6 @@ class TestSearchResponseModel:
             total=50,
             page=5,
             size=10,
-            total_pages=5,
-            has_next=False,
-            has_previous=True,
             results=[],
         )
 
@@ -323,9 +381,6 @@ class TestSearchResponseModel:
             total=10,
             page=1,
             size=10,
-            total_pages=1,
-            has_next=False,
-            has_previous=False,
             results=[],
             took_ms=15,
         )
@@ -0,0 +1,53 @@
+"""Unit tests for rate limiting helpers."""
+
+from starlette.requests import Request
+
+from src.core.rate_limit import get_client_ip
+
+
+def make_request(headers: dict[str, str] | None = None) -> Request:
+    """Build a bare ASGI request with the given headers."""
+    raw_headers = [
+        (name.lower().encode(), value.encode())
+        for name, value in (headers or {}).items()
+    ]
+    return Request(
+        {
+            "type": "http",
+            "method": "GET",
+            "path": "/",
+            "headers": raw_headers,
+            "client": ("10.0.0.1", 12345),
+        }
+    )
+
+
+class TestGetClientIp:
+    """Tests for get_client_ip."""
+
+    def test_uses_direct_client_address(self) -> None:
+        """Test fallback to the socket peer address."""
+        request = make_request()
+
+        assert get_client_ip(request) == "10.0.0.1"
+
+    def test_uses_first_forwarded_for_address(self) -> None:
+        """Test that the original client is taken from X-Forwarded-For."""
+        request = make_request({"X-Forwarded-For": "203.0.113.7, 10.0.0.2"})
+
+        assert get_client_ip(request) == "203.0.113.7"
+
+    def test_uses_single_forwarded_for_address(self) -> None:
+        """Test a header with only one address and surrounding whitespace."""
+        request = make_request({"X-Forwarded-For": " 203.0.113.7 "})
+
+        assert get_client_ip(request) == "203.0.113.7"
+
+    def test_result_is_memoized_on_request_state(self) -> None:
+        """Test that the resolved IP is stored and reused."""
+        request = make_request({"X-Forwarded-For": "203.0.113.7"})
+
+        get_client_ip(request)
+        request.state.client_ip = "198.51.100.1"
+
+        assert get_client_ip(request) == "198.51.100.1"
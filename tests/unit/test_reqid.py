@@ -0,0 +1,19 @@
+"""Unit tests for request ID generation."""
+
+import re
+
+from src.core.reqid import next_request_id
+
+
+class TestNextRequestId:
+    """Tests for next_request_id."""
+
+    def test_returns_eight_hex_chars(self) -> None:
+        """Test that IDs keep the 8-character hex format."""
+        assert re.fullmatch(r"[0-9a-f]{8}", next_request_id())
+
+    def test_ids_are_unique_across_batches(self) -> None:
+        """Test that IDs don't repeat when the pool is refilled."""
+        ids = [next_request_id() for _ in range(1200)]
+
+        assert len(set(ids)) == len(ids)
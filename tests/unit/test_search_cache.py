@@ -0,0 +1,165 @@
+"""Unit tests for the search response cache."""
+
+from unittest.mock import patch
+
+import pytest
+
+from src.models.product import SearchResponse
+from src.services.cache import FrequencySketch, SearchCache
+
+
+class TestSearchCache:
+    """Tests for SearchCache."""
+
+    @pytest.fixture
+    def response(self) -> SearchResponse:
+        """Provide a minimal search response."""
+        return SearchResponse(
+            query="iphone",
+            total=0,
+            page=1,
+            size=10,
+        )
+
+    def test_get_missing_key_returns_none(self) -> None:
+        """Test that an unknown key is a miss."""
+        cache = SearchCache(max_size=10, ttl_seconds=60)
+
+        assert cache.get(("iphone",)) is None
+        assert cache.stats()["misses"] == 1
+
+    def test_set_then_get_returns_value(self, response: SearchResponse) -> None:
+        """Test that a stored response is returned on the next lookup."""
+        cache = SearchCache(max_size=10, ttl_seconds=60)
+
+        cache.set(("iphone",), response)
+
+        assert cache.get(("iphone",)) is response
+        assert cache.stats()["hits"] == 1
+
+    def test_expired_entry_is_a_miss(self, response: SearchResponse) -> None:
+        """Test that entries are dropped once their TTL has passed."""
+        cache = SearchCache(max_size=10, ttl_seconds=60)
+
+        with patch("src.services.cache.time.monotonic", return_value=100.0):
+            cache.set(("iphone",), response)
+        with patch("src.services.cache.time.monotonic", return_value=160.0):
+            assert cache.get(("iphone",)) is None
+
+        assert len(cache) == 0
+
+    def test_set_purges_expired_entries(self, response: SearchResponse) -> None:
+        """Test that expired entries are dropped on the next insert."""
+        cache = SearchCache(max_size=10, ttl_seconds=60)
+
+        with patch("src.services.cache.time.monotonic", return_value=100.0):
+            cache.set(("a",), response)
+            cache.set(("b",), response)
+        with patch("src.services.cache.time.monotonic", return_value=130.0):
+            cache.set(("c",), response)
+        with patch("src.services.cache.time.monotonic", return_value=170.0):
+            cache.set(("d",), response)
+
+        assert len(cache) == 2
+
+    def test_evicts_oldest_when_full(self, response: SearchResponse) -> None:
+        """Test that the oldest entry is evicted at capacity."""
+        cache = SearchCache(max_size=2, ttl_seconds=60)
+
+        cache.set(("a",), response)
+        cache.set(("b",), response)
+        cache.get(("c",))
+        cache.set(("c",), response)
+
+        assert len(cache) == 2
+        assert cache.get(("a",)) is None
+        assert cache.get(("c",)) is response
+
+    def test_hit_protects_entry_from_eviction(self, response: SearchResponse) -> None:
+        """Test that the least recently used entry is evicted, not the oldest."""
+        cache = SearchCache(max_size=2, ttl_seconds=60)
+
+        cache.set(("a",), response)
+        cache.set(("b",), response)
+        cache.get(("a",))
+        cache.get(("c",))
+        cache.get(("c",))
+        cache.set(("c",), response)
+
+        assert cache.get(("a",)) is response
+        assert cache.get(("b",)) is None
+
+    def test_full_cache_rejects_colder_key(self, response: SearchResponse) -> None:
+        """Test that a one-off key can't displace a more popular entry."""
+        cache = SearchCache(max_size=2, ttl_seconds=60)
+        cache.set(("a",), response)
+        cache.set(("b",), response)
+        for _ in range(3):
+            cache.get(("a",))
+            cache.get(("b",))
+
+        cache.get(("c",))
+        cache.set(("c",), response)
+
+        assert len(cache) == 2
+        assert cache.get(("c",)) is None
+        assert cache.get(("a",)) is response
+        assert cache.get(("b",)) is response
+
+    def test_clear_removes_all_entries(self, response: SearchResponse) -> None:
+        """Test that clear empties the cache."""
+        cache = SearchCache(max_size=10, ttl_seconds=60)
+        cache.set(("a",), response)
+        cache.set(("b",), response)
+
+        cache.clear()
+
+        assert len(cache) == 0
+
+    def test_set_skips_response_from_before_clear(
+        self, response: SearchResponse
+    ) -> None:
+        """Test that a response fetched before a clear isn't stored."""
+        cache = SearchCache(max_size=10, ttl_seconds=60)
+        generation = cache.generation
+
+        cache.clear()
+        cache.set(("a",), response, generation)
+
+        assert cache.get(("a",)) is None
+
+
+class TestFrequencySketch:
+    """Tests for the TinyLFU frequency sketch."""
+
+    def test_estimate_counts_increments(self) -> None:
+        """Test that estimates track how often a key was recorded."""
+        sketch = FrequencySketch(capacity=100)
+
+        for _ in range(3):
+            sketch.increment(("iphone",))
+
+        assert sketch.estimate(("iphone",)) >= 3
+        assert sketch.estimate(("iphone",)) > sketch.estimate(("pixel",))
+
+    def test_counters_saturate(self) -> None:
+        """Test that counters stop at the 4-bit maximum."""
+        sketch = FrequencySketch(capacity=100)
+
+        for _ in range(40):
+            sketch.increment(("iphone",))
+
+        assert sketch.estimate(("iphone",)) == 15
+
+    def test_aging_halves_counts(self) -> None:
+        """Test that counters are halved once the sample size is reached."""
+        sketch = FrequencySketch(capacity=1)
+
+        # Smallest sketch is 64 counters wide, so aging runs every 640 increments
+        for _ in range(639):
+            sketch.increment(("iphone",))
+        assert sketch.estimate(("iphone",)) == 15
+
+        sketch.increment(("iphone",))
+
+        assert sketch.estimate(("iphone",)) == 7
@@ -1,8 +1,11 @@
 """Unit tests for search service."""
 
+from collections.abc import Callable
+from typing import Any
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
+from elastic_transport import ObjectApiResponse
 
 from src.config.settings import Settings
 from src.models.product import SearchQuery, SortField, SortOrder
@@ -50,29 +53,34 @@ class TestSearchService:
 
     @pytest.mark.asyncio
     async def test_search_basic_query(
-        self, mock_elastic_client: MagicMock, mock_settings: Settings
+        self,
+        es_response: Callable[[dict[str, Any]], ObjectApiResponse[Any]],
+        mock_elastic_client: MagicMock,
+        mock_settings: Settings,
     ) -> None:
         """Test basic search query execution."""
         from src.services.search import SearchService
 
         mock_elastic_client._client.search = AsyncMock(
-            return_value={
-                "took": 10,
-                "hits": {
-                    "total": {"value": 1},
-                    "hits": [
-                        {
-                            "_id": "1",
-                            "_score": 1.5,
-                            "_source": {
-                                "name": "iPhone 15",
-                                "description": "Apple smartphone",
-                                "price": 799.99,
-                            },
-                        }
-                    ],
-                },
-            }
+            return_value=es_response(
+                {
+                    "took": 10,
+                    "hits": {
+                        "total": {"value": 1},
+                        "hits": [
+                            {
+                                "_id": "1",
+                                "_score": 1.5,
+                                "_source": {
+                                    "name": "iPhone 15",
+                                    "description": "Apple smartphone",
+                                    "price": 799.99,
+                                },
+                            }
+                        ],
+                    },
+                }
+            )
         )
 
         service = SearchService(mock_elastic_client, mock_settings)
@@ -84,32 +92,38 @@ class TestSearchService:
         assert response.query == "iphone"
         assert len(response.results) == 1
         assert response.results[0].name == "iPhone 15"
+        assert response.model_dump(mode="json")["results"][0]["name"] == "iPhone 15"
 
     @pytest.mark.asyncio
     async def test_search_returns_score(
-        self, mock_elastic_client: MagicMock, mock_settings: Settings
+        self,
+        es_response: Callable[[dict[str, Any]], ObjectApiResponse[Any]],
+        mock_elastic_client: MagicMock,
+        mock_settings: Settings,
     ) -> None:
         """Test search results include relevance score."""
         from src.services.search import SearchService
 
         mock_elastic_client._client.search = AsyncMock(
-            return_value={
-                "took": 5,
-                "hits": {
-                    "total": {"value": 1},
-                    "hits": [
-                        {
-                            "_id": "1",
-                            "_score": 2.5,
-                            "_source": {
-                                "name": "iPhone 15",
-                                "description": "Apple smartphone",
-                                "price": 799.99,
-                            },
-                        }
-                    ],
-                },
-            }
+            return_value=es_response(
+                {
+                    "took": 5,
+                    "hits": {
+                        "total": {"value": 1},
+                        "hits": [
+                            {
+                                "_id": "1",
+                                "_score": 2.5,
+                                "_source": {
+                                    "name": "iPhone 15",
+                                    "description": "Apple smartphone",
+                                    "price": 799.99,
+                                },
+                            }
+                        ],
+                    },
+                }
+            )
         )
 
         service = SearchService(mock_elastic_client, mock_settings)
@@ -121,32 +135,37 @@ class TestSearchService:
 
     @pytest.mark.asyncio
     async def test_search_with_highlights(
-        self, mock_elastic_client: MagicMock, mock_settings: Settings
+        self,
+        es_response: Callable[[dict[str, Any]], ObjectApiResponse[Any]],
+        mock_elastic_client: MagicMock,
+        mock_settings: Settings,
     ) -> None:
         """Test search results include highlights."""
         from src.services.search import SearchService
 
         mock_elastic_client._client.search = AsyncMock(
-            return_value={
-                "took": 5,
-                "hits": {
-                    "total": {"value": 1},
-                    "hits": [
-                        {
-                            "_id": "1",
-                            "_score": 2.5,
-                            "_source": {
-                                "name": "iPhone 15",
-                                "description": "Apple smartphone",
-                                "price": 799.99,
-                            },
-                            "highlight": {
-                                "name": ["<em>iPhone</em> 15"],
-                            },
-                        }
-                    ],
-                },
-            }
+            return_value=es_response(
+                {
+                    "took": 5,
+                    "hits": {
+                        "total": {"value": 1},
+                        "hits": [
+                            {
+                                "_id": "1",
+                                "_score": 2.5,
+                                "_source": {
+                                    "name": "iPhone 15",
+                                    "description": "Apple smartphone",
+                                    "price": 799.99,
+                                },
+                                "highlight": {
+                                    "name": ["<em>iPhone</em> 15"],
+                                },
+                            }
+                        ],
+                    },
+                }
+            )
         )
 
         service = SearchService(mock_elastic_client, mock_settings)
@@ -159,19 +178,24 @@ class TestSearchService:
 
     @pytest.mark.asyncio
     async def test_search_no_results(
-        self, mock_elastic_client: MagicMock, mock_settings: Settings
+        self,
+        es_response: Callable[[dict[str, Any]], ObjectApiResponse[Any]],
+        mock_elastic_client: MagicMock,
+        mock_settings: Settings,
     ) -> None:
         """Test search with no matching results."""
         from src.services.search import SearchService
 
         mock_elastic_client._client.search = AsyncMock(
-            return_value={
-                "took": 2,
-                "hits": {
-                    "total": {"value": 0},
-                    "hits": [],
-                },
-            }
+            return_value=es_response(
+                {
+                    "took": 2,
+                    "hits": {
+                        "total": {"value": 0},
+                        "hits": [],
+                    },
+                }
+            )
         )
 
         service = SearchService(mock_elastic_client, mock_settings)
@@ -184,19 +208,24 @@ class TestSearchService:
 
     @pytest.mark.asyncio
     async def test_search_pagination(
-        self, mock_elastic_client: MagicMock, mock_settings: Settings
+        self,
+        es_response: Callable[[dict[str, Any]], ObjectApiResponse[Any]],
+        mock_elastic_client: MagicMock,
+        mock_settings: Settings,
     ) -> None:
         """Test search pagination parameters."""
         from src.services.search import SearchService
 
         mock_elastic_client._client.search = AsyncMock(
-            return_value={
-                "took": 5,
-                "hits": {
-                    "total": {"value": 50},
-                    "hits": [],
-                },
-            }
+            return_value=es_response(
+                {
+                    "took": 5,
+                    "hits": {
+                        "total": {"value": 50},
+                        "hits": [],
+                    },
+                }
+            )
         )
 
         service = SearchService(mock_elastic_client, mock_settings)
@@ -215,19 +244,24 @@ class TestSearchService:
 
     @pytest.mark.asyncio
     async def test_search_took_time(
-        self, mock_elastic_client: MagicMock, mock_settings: Settings
+        self,
+        es_response: Callable[[dict[str, Any]], ObjectApiResponse[Any]],
+        mock_elastic_client: MagicMock,
+        mock_settings: Settings,
     ) -> None:
         """Test search response includes query time."""
         from src.services.search import SearchService
 
         mock_elastic_client._client.search = AsyncMock(
-            return_value={
-                "took": 15,
-                "hits": {
-                    "total": {"value": 0},
-                    "hits": [],
-                },
-            }
+            return_value=es_response(
+                {
+                    "took": 15,
+                    "hits": {
+                        "total": {"value": 0},
+                        "hits": [],
+                    },
+                }
+            )
         )
 
         service = SearchService(mock_elastic_client, mock_settings)
@@ -237,6 +271,126 @@ class TestSearchService:
 
         assert response.took_ms == 15
 
+    @pytest.mark.asyncio
+    async def test_search_skips_debug_logs_when_disabled(
+        self,
+        es_response: Callable[[dict[str, Any]], ObjectApiResponse[Any]],
+        mock_elastic_client: MagicMock,
+        mock_settings: Settings,
+    ) -> None:
+        """Test that debug events aren't built when DEBUG is off."""
+        from unittest.mock import patch
+
+        from src.services.search import SearchService
+
+        mock_elastic_client._client.search = AsyncMock(
+            return_value=es_response(
+                {"took": 1, "hits": {"total": {"value": 0}, "hits": []}}
+            )
+        )
+        service = SearchService(mock_elastic_client, mock_settings)
+
+        with patch("src.services.search.logger") as mock_logger:
+            mock_logger.is_enabled_for.return_value = False
+
+            await service.search(SearchQuery(q="test"))
+
+            mock_logger.debug.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_search_requests_only_parsed_fields(
+        self,
+        es_response: Callable[[dict[str, Any]], ObjectApiResponse[Any]],
+        mock_elastic_client: MagicMock,
+        mock_settings: Settings,
+    ) -> None:
+        """Test that _source and response metadata are trimmed."""
+        from src.services.search import SearchService
+
+        mock_elastic_client._client.search = AsyncMock(
+            return_value=es_response(
+                {"took": 1, "hits": {"total": {"value": 0}, "hits": []}}
+            )
+        )
+        service = SearchService(mock_elastic_client, mock_settings)
+
+        await service.search(SearchQuery(q="test"))
+
+        call_kwargs = mock_elastic_client._client.search.call_args.kwargs
+        assert call_kwargs["source"] == ["name", "description", "price", "category"]
+        assert "hits.hits._source" in call_kwargs["filter_path"]
+
+    @pytest.mark.asyncio
+    async def test_search_handles_filtered_empty_response(
+        self,
+        es_response: Callable[[dict[str, Any]], ObjectApiResponse[Any]],
+        mock_elastic_client: MagicMock,
+        mock_settings: Settings,
+    ) -> None:
+        """Test that a response with no hits.hits (no matches) parses."""
+        from src.services.search import SearchService
+
+        mock_elastic_client._client.search = AsyncMock(
+            return_value=es_response({"took": 1, "hits": {"total": {"value": 0}}})
+        )
+        service = SearchService(mock_elastic_client, mock_settings)
+
+        response = await service.search(SearchQuery(q="test"))
+
+        assert response.total == 0
+        assert response.results == []
+
+    @pytest.mark.asyncio
+    async def test_search_caps_total_hit_counting(
+        self,
+        es_response: Callable[[dict[str, Any]], ObjectApiResponse[Any]],
+        mock_elastic_client: MagicMock,
+        mock_settings: Settings,
+    ) -> None:
+        """Test that total counting stops past the configured cap or page."""
+        from src.services.search import SearchService
+
+        mock_elastic_client._client.search = AsyncMock(
+            return_value=es_response(
+                {"took": 1, "hits": {"total": {"value": 0}, "hits": []}}
+            )
+        )
+        service = SearchService(mock_elastic_client, mock_settings)
+
+        await service.search(SearchQuery(q="test"))
+        first_page = mock_elastic_client._client.search.call_args.kwargs
+        await service.search(SearchQuery(q="test", page=200, size=10))
+        deep_page = mock_elastic_client._client.search.call_args.kwargs
+
+        assert first_page["track_total_hits"] == mock_settings.search_track_total_hits
+        assert deep_page["track_total_hits"] == 2001
+
+    @pytest.mark.asyncio
+    async def test_search_reports_lower_bound_total(
+        self,
+        es_response: Callable[[dict[str, Any]], ObjectApiResponse[Any]],
+        mock_elastic_client: MagicMock,
+        mock_settings: Settings,
+    ) -> None:
+        """Test that a capped total is reported as a lower bound."""
+        from src.services.search import SearchService
+
+        mock_elastic_client._client.search = AsyncMock(
+            return_value=es_response(
+                {
+                    "took": 1,
+                    "hits": {"total": {"value": 1000, "relation": "gte"}, "hits": []},
+                }
+            )
+        )
+        service = SearchService(mock_elastic_client, mock_settings)
+
+        response = await service.search(SearchQuery(q="test"))
+
+        assert response.total == 1000
+        assert response.total_relation == "gte"
+        assert response.has_next is True
+
 
 class TestSearchQueryBuilder:
     """Tests for search query building."""
@@ -250,17 +404,23 @@ class TestSearchQueryBuilder:
         )
 
     @pytest.fixture
-    def mock_elastic_client(self, mock_settings: Settings) -> MagicMock:
+    def mock_elastic_client(
+        self,
+        es_response: Callable[[dict[str, Any]], ObjectApiResponse[Any]],
+        mock_settings: Settings,
+    ) -> MagicMock:
         """Provide mock ElasticsearchClient."""
         from src.elastic.client import ElasticsearchClient
 
         client = ElasticsearchClient(mock_settings)
         client._client = MagicMock()
         client._client.search = AsyncMock(
-            return_value={
-                "took": 5,
-                "hits": {"total": {"value": 0}, "hits": []},
-            }
+            return_value=es_response(
+                {
+                    "took": 5,
+                    "hits": {"total": {"value": 0}, "hits": []},
+                }
+            )
         )
         return client
 
@@ -283,6 +443,26 @@ class TestSearchQueryBuilder:
         assert "multi_match" in query_body
         assert query_body["multi_match"]["fuzziness"] == "AUTO"
 
+    @pytest.mark.asyncio
+    async def test_fuzzy_search_bounds_term_expansion(
+        self, mock_elastic_client: MagicMock, mock_settings: Settings
+    ) -> None:
+        """Test fuzzy matching uses the configured prefix length and expansions."""
+        from src.services.search import SearchService
+
+        service = SearchService(mock_elastic_client, mock_settings)
+        query = SearchQuery(q="iphon", fuzzy=True)
+
+        await service.search(query)
+
+        call_kwargs = mock_elastic_client._client.search.call_args.kwargs
+        multi_match = call_kwargs["query"]["multi_match"]
+
+        assert multi_match["prefix_length"] == mock_settings.search_fuzzy_prefix_length
+        assert (
+            multi_match["max_expansions"] == mock_settings.search_fuzzy_max_expansions
+        )
+
     @pytest.mark.asyncio
     async def test_fuzzy_search_disabled(
         self, mock_elastic_client: MagicMock, mock_settings: Settings
@@ -375,7 +555,7 @@ class TestSearchQueryBuilder:
         query_body = call_kwargs["query"]
 
         assert "bool" in query_body
-        assert "filter" in query_body["bool"]
+        assert {"terms": {"category": ["Electronics"]}} in query_body["bool"]["filter"]
 
     @pytest.mark.asyncio
     async def test_highlight_configuration(
@@ -446,6 +626,41 @@ class TestSearchQueryBuilder:
         assert terms_filter is not None
         assert term_filter is None
 
+    @pytest.mark.asyncio
+    async def test_wildcard_query_matches_all(
+        self, mock_elastic_client: MagicMock, mock_settings: Settings
+    ) -> None:
+        """Test that a bare * browses without scoring."""
+        from src.services.search import SearchService
+
+        service = SearchService(mock_elastic_client, mock_settings)
+
+        await service.search(SearchQuery(q="*"))
+
+        call_kwargs = mock_elastic_client._client.search.call_args.kwargs
+        assert call_kwargs["query"] == {"match_all": {}}
+        assert call_kwargs["sort"] == [{"_doc": {"order": "asc"}}]
+
+    @pytest.mark.asyncio
+    async def test_blank_query_with_filters_uses_constant_score(
+        self, mock_elastic_client: MagicMock, mock_settings: Settings
+    ) -> None:
+        """Test that filter-only browsing wraps the filters in constant_score."""
+        from src.services.search import SearchService
+
+        service = SearchService(mock_elastic_client, mock_settings)
+
+        await service.search(SearchQuery(q=" ", category="Electronics"))
+
+        call_kwargs = mock_elastic_client._client.search.call_args.kwargs
+        assert call_kwargs["query"] == {
+            "constant_score": {
+                "filter": {
+                    "bool": {"filter": [{"terms": {"category": ["Electronics"]}}]}
+                }
+            }
+        }
+
 
 class TestSortBuilder:
     """Tests for sort building functionality."""
@@ -459,17 +674,23 @@ class TestSortBuilder:
         )
 
     @pytest.fixture
-    def mock_elastic_client(self, mock_settings: Settings) -> MagicMock:
+    def mock_elastic_client(
+        self,
+        es_response: Callable[[dict[str, Any]], ObjectApiResponse[Any]],
+        mock_settings: Settings,
+    ) -> MagicMock:
         """Provide mock ElasticsearchClient."""
         from src.elastic.client import ElasticsearchClient
 
         client = ElasticsearchClient(mock_settings)
         client._client = MagicMock()
         client._client.search = AsyncMock(
-            return_value={
-                "took": 5,
-                "hits": {"total": {"value": 0}, "hits": []},
-            }
+            return_value=es_response(
+                {
+                    "took": 5,
+                    "hits": {"total": {"value": 0}, "hits": []},
+                }
+            )
         )
         return client
 
@@ -488,6 +709,21 @@ class TestSortBuilder:
         call_kwargs = mock_elastic_client._client.search.call_args.kwargs
         assert "sort" not in call_kwargs
 
+    @pytest.mark.asyncio
+    async def test_browse_with_explicit_sort_keeps_it(
+        self, mock_elastic_client: MagicMock, mock_settings: Settings
+    ) -> None:
+        """Test that browsing only falls back to index order for relevance."""
+        from src.services.search import SearchService
+
+        service = SearchService(mock_elastic_client, mock_settings)
+        query = SearchQuery(q="*", sort_by=SortField.PRICE, sort_order=SortOrder.ASC)
+
+        await service.search(query)
+
+        call_kwargs = mock_elastic_client._client.search.call_args.kwargs
+        assert call_kwargs["sort"] == [{"price": {"order": "asc"}}]
+
     @pytest.mark.asyncio
     async def test_sort_by_price_asc(
         self, mock_elastic_client: MagicMock, mock_settings: Settings
@@ -496,7 +732,9 @@ class TestSortBuilder:
         from src.services.search import SearchService
 
         service = SearchService(mock_elastic_client, mock_settings)
-        query = SearchQuery(q="phone", sort_by=SortField.PRICE, sort_order=SortOrder.ASC)
+        query = SearchQuery(
+            q="phone", sort_by=SortField.PRICE, sort_order=SortOrder.ASC
+        )
 
         await service.search(query)
 
@@ -546,7 +784,9 @@ class TestSortBuilder:
         from src.services.search import SearchService
 
         service = SearchService(mock_elastic_client, mock_settings)
-        query = SearchQuery(q="phone", sort_by=SortField.NAME, sort_order=SortOrder.DESC)
+        query = SearchQuery(
+            q="phone", sort_by=SortField.NAME, sort_order=SortOrder.DESC
+        )
 
         await service.search(query)
 
@@ -577,16 +817,21 @@ class TestPaginationMetadata:
 
     @pytest.mark.asyncio
     async def test_pagination_first_page(
-        self, mock_elastic_client: MagicMock, mock_settings: Settings
+        self,
+        es_response: Callable[[dict[str, Any]], ObjectApiResponse[Any]],
+        mock_elastic_client: MagicMock,
+        mock_settings: Settings,
     ) -> None:
         """Test pagination metadata on first page."""
         from src.services.search import SearchService
 
         mock_elastic_client._client.search = AsyncMock(
-            return_value={
-                "took": 5,
-                "hits": {"total": {"value": 50}, "hits": []},
-            }
+            return_value=es_response(
+                {
+                    "took": 5,
+                    "hits": {"total": {"value": 50}, "hits": []},
+                }
+            )
         )
 
         service = SearchService(mock_elastic_client, mock_settings)
@@ -600,16 +845,21 @@ class TestPaginationMetadata:
 
     @pytest.mark.asyncio
     async def test_pagination_middle_page(
-        self, mock_elastic_client: MagicMock, mock_settings: Settings
+        self,
+        es_response: Callable[[dict[str, Any]], ObjectApiResponse[Any]],
+        mock_elastic_client: MagicMock,
+        mock_settings: Settings,
     ) -> None:
         """Test pagination metadata on middle page."""
         from src.services.search import SearchService
 
         mock_elastic_client._client.search = AsyncMock(
-            return_value={
-                "took": 5,
-                "hits": {"total": {"value": 50}, "hits": []},
-            }
+            return_value=es_response(
+                {
+                    "took": 5,
+                    "hits": {"total": {"value": 50}, "hits": []},
+                }
+            )
         )
 
         service = SearchService(mock_elastic_client, mock_settings)
@@ -623,16 +873,21 @@ class TestPaginationMetadata:
 
     @pytest.mark.asyncio
     async def test_pagination_last_page(
-        self, mock_elastic_client: MagicMock, mock_settings: Settings
+        self,
+        es_response: Callable[[dict[str, Any]], ObjectApiResponse[Any]],
+        mock_elastic_client: MagicMock,
+        mock_settings: Settings,
     ) -> None:
         """Test pagination metadata on last page."""
         from src.services.search import SearchService
 
         mock_elastic_client._client.search = AsyncMock(
-            return_value={
-                "took": 5,
-                "hits": {"total": {"value": 50}, "hits": []},
-            }
+            return_value=es_response(
+                {
+                    "took": 5,
+                    "hits": {"total": {"value": 50}, "hits": []},
+                }
+            )
         )
 
         service = SearchService(mock_elastic_client, mock_settings)
@@ -646,16 +901,21 @@ class TestPaginationMetadata:
 
     @pytest.mark.asyncio
     async def test_pagination_single_page(
-        self, mock_elastic_client: MagicMock, mock_settings: Settings
+        self,
+        es_response: Callable[[dict[str, Any]], ObjectApiResponse[Any]],
+        mock_elastic_client: MagicMock,
+        mock_settings: Settings,
     ) -> None:
         """Test pagination metadata when only one page."""
         from src.services.search import SearchService
 
         mock_elastic_client._client.search = AsyncMock(
-            return_value={
-                "took": 5,
-                "hits": {"total": {"value": 5}, "hits": []},
-            }
+            return_value=es_response(
+                {
+                    "took": 5,
+                    "hits": {"total": {"value": 5}, "hits": []},
+                }
+            )
         )
 
         service = SearchService(mock_elastic_client, mock_settings)
@@ -669,16 +929,21 @@ class TestPaginationMetadata:
 
     @pytest.mark.asyncio
     async def test_pagination_no_results(
-        self, mock_elastic_client: MagicMock, mock_settings: Settings
+        self,
+        es_response: Callable[[dict[str, Any]], ObjectApiResponse[Any]],
+        mock_elastic_client: MagicMock,
+        mock_settings: Settings,
     ) -> None:
         """Test pagination metadata with no results."""
         from src.services.search import SearchService
 
         mock_elastic_client._client.search = AsyncMock(
-            return_value={
-                "took": 5,
-                "hits": {"total": {"value": 0}, "hits": []},
-            }
+            return_value=es_response(
+                {
+                    "took": 5,
+                    "hits": {"total": {"value": 0}, "hits": []},
+                }
+            )
         )
 
         service = SearchService(mock_elastic_client, mock_settings)
@@ -692,16 +957,21 @@ class TestPaginationMetadata:
 
     @pytest.mark.asyncio
     async def test_pagination_partial_last_page(
-        self, mock_elastic_client: MagicMock, mock_settings: Settings
+        self,
+        es_response: Callable[[dict[str, Any]], ObjectApiResponse[Any]],
+        mock_elastic_client: MagicMock,
+        mock_settings: Settings,
     ) -> None:
         """Test total_pages calculation with partial last page."""
         from src.services.search import SearchService
 
         mock_elastic_client._client.search = AsyncMock(
-            return_value={
-                "took": 5,
-                "hits": {"total": {"value": 45}, "hits": []},
-            }
+            return_value=es_response(
+                {
+                    "took": 5,
+                    "hits": {"total": {"value": 45}, "hits": []},
+                }
+            )
         )
 
         service = SearchService(mock_elastic_client, mock_settings)
@@ -714,29 +984,34 @@ class TestPaginationMetadata:
 
     @pytest.mark.asyncio
     async def test_score_defaults_to_zero_when_none(
-        self, mock_elastic_client: MagicMock, mock_settings: Settings
+        self,
+        es_response: Callable[[dict[str, Any]], ObjectApiResponse[Any]],
+        mock_elastic_client: MagicMock,
+        mock_settings: Settings,
     ) -> None:
         """Test score defaults to 0.0 when ES returns None (non-relevance sort)."""
         from src.services.search import SearchService
 
         mock_elastic_client._client.search = AsyncMock(
-            return_value={
-                "took": 5,
-                "hits": {
-                    "total": {"value": 1},
-                    "hits": [
-                        {
-                            "_id": "1",
-                            "_score": None,  # ES returns null for non-relevance sort
-                            "_source": {
-                                "name": "Test Product",
-                                "description": "Description",
-                                "price": 99.99,
-                            },
-                        }
-                    ],
-                },
-            }
+            return_value=es_response(
+                {
+                    "took": 5,
+                    "hits": {
+                        "total": {"value": 1},
+                        "hits": [
+                            {
+                                "_id": "1",
+                                "_score": None,  # ES returns null for non-relevance sort
+                                "_source": {
+                                    "name": "Test Product",
+                                    "description": "Description",
+                                    "price": 99.99,
+                                },
+                            }
+                        ],
+                    },
+                }
+            )
         )
 
         service = SearchService(mock_elastic_client, mock_settings)
@@ -746,6 +1021,109 @@ class TestPaginationMetadata:
 
         assert response.results[0].score == 0.0
 
+    @pytest.mark.asyncio
+    async def test_search_uses_cache_on_repeat_query(
+        self,
+        es_response: Callable[[dict[str, Any]], ObjectApiResponse[Any]],
+        mock_elastic_client: MagicMock,
+        mock_settings: Settings,
+    ) -> None:
+        """Test that a repeated query is served from the cache."""
+        from src.services.cache import SearchCache
+        from src.services.search import SearchService
+
+        mock_elastic_client._client.search = AsyncMock(
+            return_value=es_response(
+                {"took": 1, "hits": {"total": {"value": 0}, "hits": []}}
+            )
+        )
+
+        cache = SearchCache(max_size=10, ttl_seconds=60)
+        service = SearchService(mock_elastic_client, mock_settings, cache)
+
+        first = await service.search(SearchQuery(q="iphone"))
+        second = await service.search(SearchQuery(q="iphone"))
+
+        assert second is first
+        mock_elastic_client._client.search.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_search_in_flight_during_invalidation_is_not_cached(
+        self,
+        es_response: Callable[[dict[str, Any]], ObjectApiResponse[Any]],
+        mock_elastic_client: MagicMock,
+        mock_settings: Settings,
+    ) -> None:
+        """Test that a search overlapping a write doesn't cache stale results."""
+        from src.services.cache import SearchCache
+        from src.services.search import SearchService
+
+        cache = SearchCache(max_size=10, ttl_seconds=60)
+
+        async def search_during_write(**_kwargs: Any) -> dict[str, Any]:
+            # A write becomes visible and clears the cache mid-request
+            cache.clear()
+            return es_response({"took": 1, "hits": {"total": {"value": 0}, "hits": []}})
+
+        mock_elastic_client._client.search = AsyncMock(side_effect=search_during_write)
+        service = SearchService(mock_elastic_client, mock_settings, cache)
+
+        await service.search(SearchQuery(q="iphone"))
+
+        assert len(cache) == 0
+
+    @pytest.mark.asyncio
+    async def test_search_cache_key_distinguishes_filters(
+        self,
+        es_response: Callable[[dict[str, Any]], ObjectApiResponse[Any]],
+        mock_elastic_client: MagicMock,
+        mock_settings: Settings,
+    ) -> None:
+        """Test that queries with different filters are cached separately."""
+        from src.services.cache import SearchCache
+        from src.services.search import SearchService
+
+        mock_elastic_client._client.search = AsyncMock(
+            return_value=es_response(
+                {"took": 1, "hits": {"total": {"value": 0}, "hits": []}}
+            )
+        )
+
+        cache = SearchCache(max_size=10, ttl_seconds=60)
+        service = SearchService(mock_elastic_client, mock_settings, cache)
+
+        await service.search(SearchQuery(q="phone"))
+        await service.search(SearchQuery(q="phone", category="Electronics"))
+
+        assert mock_elastic_client._client.search.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_search_cache_key_shares_equivalent_category_filters(
+        self,
+        es_response: Callable[[dict[str, Any]], ObjectApiResponse[Any]],
+        mock_elastic_client: MagicMock,
+        mock_settings: Settings,
+    ) -> None:
+        """Test that equivalent category filters hit the same cache entry."""
+        from src.services.cache import SearchCache
+        from src.services.search import SearchService
+
+        mock_elastic_client._client.search = AsyncMock(
+            return_value=es_response(
+                {"took": 1, "hits": {"total": {"value": 0}, "hits": []}}
+            )
+        )
+
+        cache = SearchCache(max_size=10, ttl_seconds=60)
+        service = SearchService(mock_elastic_client, mock_settings, cache)
+
+        await service.search(SearchQuery(q="phone", categories=["Phones", "Audio"]))
+        await service.search(SearchQuery(q="phone", categories=["Audio", "Phones"]))
+        await service.search(SearchQuery(q="phone", category="Audio"))
+        await service.search(SearchQuery(q="phone", categories=["Audio"]))
+
+        assert mock_elastic_client._client.search.call_count == 2
+
 
 class TestGetSearchService:
     """Tests for get_search_service factory."""
@@ -758,3 +1136,9 @@ class TestGetSearchService:
 
         assert service is not None
         assert service.index_name is not None
+
+    def test_get_search_service_returns_singleton(self) -> None:
+        """Test factory returns the same instance on every call."""
+        from src.services.search import get_search_service
+
+        assert get_search_service() is get_search_service()
@@ -1,5 +1,8 @@
 """Unit tests for configuration settings."""
 
+import pytest
+from pydantic import ValidationError
+
 from src.config.settings import Settings, get_settings
 
 
@@ -15,6 +18,7 @@ class TestSettings:
         assert settings.debug is False
         assert settings.host == "0.0.0.0"
         assert settings.port == 8000
+        assert settings.web_concurrency == 1
 
     def test_elasticsearch_defaults(self) -> None:
         """Test Elasticsearch default configuration."""
@@ -23,6 +27,7 @@ class TestSettings:
         assert settings.elasticsearch_url == "http://localhost:9200"
         assert settings.elasticsearch_index == "products"
         assert settings.elasticsearch_timeout == 30
+        assert settings.elasticsearch_http_compress is False
 
     def test_settings_override(self) -> None:
         """Test that settings can be overridden."""
@@ -42,3 +47,16 @@ class TestSettings:
         settings2 = get_settings()
 
         assert settings1 is settings2
+
+    def test_settings_are_immutable(self) -> None:
+        """Test that settings cannot be changed after load."""
+        settings = Settings()
+
+        with pytest.raises(ValidationError):
+            settings.debug = True  # type: ignore[misc]
+
+    @pytest.mark.parametrize("field", ["cache_max_size", "cache_ttl_seconds"])
+    def test_cache_limits_must_be_positive(self, field: str) -> None:
+        """Test that a zero-sized or zero-TTL cache is rejected at load."""
+        with pytest.raises(ValidationError):
+            Settings(**{field: 0})